@@ -4,7 +4,11 @@ import plotly.express as px
 import os
 
 from utils.preprocessing import prepare_medals_datasets, normalize_name
-from utils.filters import global_filters, apply_global_filters
+from utils.filters import global_filters, apply_global_filters, filters_are_default
+from utils.leaderboard import build_leaderboard, top_n
+from utils.shared_data import cache_frames
+from utils.views import load_views
+from utils.aggregations import aggregate_medal_pie, overview_kpis
 
 # -----------------------------------------------------
 # Page setup
@@ -21,9 +25,13 @@ st.markdown("### Explore the world of sports at a glance, uncover how nations, a
 # -----------------------------------------------------
 # Load datasets
 # -----------------------------------------------------
-df_medals_total, df_medallists, df_medals = prepare_medals_datasets()
+@cache_frames("medals")
+def load_medal_data():
+    return prepare_medals_datasets()
 
-@st.cache_data
+df_medals_total, df_medallists, df_medals = load_medal_data()
+
+@cache_frames("home_extra")
 def load_extra_data():
     DATA = os.path.join(os.path.dirname(__file__), "data")
     athletes = pd.read_csv(f"{DATA}/athletes.csv")
@@ -34,11 +42,21 @@ def load_extra_data():
 
 athletes, teams, events, nocs = load_extra_data()
 
+@st.cache_resource
+def load_leaderboard():
+    medals_total, _, _ = prepare_medals_datasets()
+    return build_leaderboard(medals_total)
+
+leaderboard = load_leaderboard()
+
 # -----------------------------------------------------
 # Filters based on ATHLETES (not medallists)
 # -----------------------------------------------------
 filters = global_filters(athletes)
 
+# Default filters: serve the deploy-time materialized views when available
+views = load_views("home") if filters_are_default(filters, athletes) else None
+
 # -----------------------------------------------------
 # Normalize medallist names once
 # -----------------------------------------------------
@@ -53,11 +71,9 @@ df_filtered_medallists = apply_global_filters(df_medallists, filters)
 athletes["name_norm"] = athletes["name"].apply(normalize_name)
 
 if filters["selected_countries"]:
-    mask_ath = athletes["country_code"].isin(filters["selected_countries"])
+    athletes_filtered = athletes[athletes["country_code"].isin(filters["selected_countries"])]
 else:
-    mask_ath = pd.Series(True, index=athletes.index)
-
-athletes_filtered = athletes[mask_ath].copy()
+    athletes_filtered = athletes
 
 # -----------------------------------------------------
 # Filtered medals_total (by NOC)
@@ -67,25 +83,22 @@ if filters["selected_countries"]:
         df_medals_total["country_code"].isin(filters["selected_countries"])
     ]
 else:
-    df_medals_total_filtered = df_medals_total.copy()
+    df_medals_total_filtered = df_medals_total
 
 # -----------------------------------------------------
 # KPI SECTION
 # -----------------------------------------------------
 st.subheader("📊 Overall Statistics ")
 
-total_athletes = athletes_filtered["name"].nunique()
-total_countries = len(filters["selected_countries"]) if filters["selected_countries"] else df_medals_total["country_code"].nunique()
-total_sports = events["sport"].nunique()
-total_medals = df_medals_total_filtered["Total"].sum()
-total_events = events["event"].nunique()
+if views is not None:
+    kpis = views["kpis"].iloc[0].to_dict()
+else:
+    kpis = overview_kpis(
+        athletes_filtered, df_medals_total, df_medals_total_filtered, events, filters["selected_countries"]
+    )
 
-c1, c2, c3, c4, c5 = st.columns(5)
-c1.metric("Athletes", f"{total_athletes:,}")
-c2.metric("Countries", f"{total_countries:,}")
-c3.metric("Sports", f"{total_sports:,}")
-c4.metric("Total Medals", f"{total_medals:,}")
-c5.metric("Events", f"{total_events:,}")
+for col, (label, value) in zip(st.columns(5), kpis.items()):
+    col.metric(label, f"{value:,}")
 
 st.markdown("---")
 
@@ -95,51 +108,57 @@ st.markdown("---")
 st.header("🔍 Athlete Profile")
 st.markdown("Select an athlete to view medal history and profile information.")
 
-# Clean athlete names: remove numeric-only garbage like "671"
-valid_names = [
-    n for n in athletes_filtered["name"].unique()
-    if isinstance(n, str) and not n.strip().isdigit()
-]
+# Fragment: choosing an athlete reruns only this section, not the
+# loading, filtering and charts of the rest of the page
+@st.fragment
+def athlete_profile_section(athletes_filtered, df_medallists):
+    # Clean athlete names: remove numeric-only garbage like "671"
+    valid_names = [
+        n for n in athletes_filtered["name"].unique()
+        if isinstance(n, str) and not n.strip().isdigit()
+    ]
 
-dropdown_names = sorted(valid_names)
+    dropdown_names = sorted(valid_names)
 
-selected_athlete = st.selectbox("Choose an athlete:", [""] + dropdown_names)
+    selected_athlete = st.selectbox("Choose an athlete:", [""] + dropdown_names)
 
-if selected_athlete:
+    if selected_athlete:
 
-    # Athlete row
-    athlete_row = athletes_filtered[
-        athletes_filtered["name"] == selected_athlete
-    ].iloc[0]
+        # Athlete row
+        athlete_row = athletes_filtered[
+            athletes_filtered["name"] == selected_athlete
+        ].iloc[0]
 
-    # Normalized key
-    norm_selected = normalize_name(selected_athlete)
+        # Normalized key
+        norm_selected = normalize_name(selected_athlete)
 
-    # Medals from ALL medallists (not filtered)
-    athlete_medals = df_medallists[
-        df_medallists["name_norm"] == norm_selected
-    ]
+        # Medals from ALL medallists (not filtered)
+        athlete_medals = df_medallists[
+            df_medallists["name_norm"] == norm_selected
+        ]
 
-    left, right = st.columns([3, 2])
+        left, right = st.columns([3, 2])
 
-    with left:
-        st.subheader(f"🏅 {selected_athlete} ({athlete_row['country']})")
-        st.markdown(f"**Gender:** {athlete_row.get('gender', 'N/A')}")
+        with left:
+            st.subheader(f"🏅 {selected_athlete} ({athlete_row['country']})")
+            st.markdown(f"**Gender:** {athlete_row.get('gender', 'N/A')}")
 
-    with right:
-        st.subheader("Medal Summary")
+        with right:
+            st.subheader("Medal Summary")
 
-        if athlete_medals.empty:
-            st.info("This athlete has no medals.")
-        else:
-            medal_counts = athlete_medals["medal_type"].value_counts()
-            c1, c2, c3 = st.columns(3)
-            c1.metric("Gold", medal_counts.get("Gold", 0))
-            c2.metric("Silver", medal_counts.get("Silver", 0))
-            c3.metric("Bronze", medal_counts.get("Bronze", 0))
+            if athlete_medals.empty:
+                st.info("This athlete has no medals.")
+            else:
+                medal_counts = athlete_medals["medal_type"].value_counts()
+                c1, c2, c3 = st.columns(3)
+                c1.metric("Gold", medal_counts.get("Gold", 0))
+                c2.metric("Silver", medal_counts.get("Silver", 0))
+                c3.metric("Bronze", medal_counts.get("Bronze", 0))
 
-else:
-    st.info("Select an athlete or adjust country filters.")
+    else:
+        st.info("Select an athlete or adjust country filters.")
+
+athlete_profile_section(athletes_filtered, df_medallists)
 
 st.markdown("---")
 
@@ -148,14 +167,10 @@ st.markdown("---")
 # -----------------------------------------------------
 st.header("🥇 Global Medal Distribution (Filtered)")
 
-medal_sum = df_medals_total_filtered[["Gold", "Silver", "Bronze"]].sum()
-
-df_pie = pd.DataFrame({
-    "Medal": ["Gold", "Silver", "Bronze"],
-    "Count": medal_sum.values
-})
-
-df_pie = df_pie[df_pie["Medal"].isin(filters["selected_medal_types"])]
+if views is not None:
+    df_pie = views["medal_pie"]
+else:
+    df_pie = aggregate_medal_pie(df_medals_total_filtered, filters["selected_medal_types"])
 
 if df_pie["Count"].sum() > 0:
     fig = px.pie(
@@ -180,16 +195,10 @@ st.markdown("---")
 # -----------------------------------------------------
 st.header("🥇 Top 10 Countries by Medals")
 
-top10 = df_medals_total_filtered.groupby("country_code")["Total"].sum().reset_index()
-
-top10 = top10.merge(
-    nocs[["code", "country"]],
-    left_on="country_code",
-    right_on="code",
-    how="left"
-)
-
-top10 = top10.sort_values("Total", ascending=False).head(10)
+if views is not None:
+    top10 = views["top10"]
+else:
+    top10 = top_n(leaderboard, "total", 10, countries=filters["selected_countries"])
 
 if not top10.empty:
     fig = px.bar(
@@ -0,0 +1,143 @@
+import os
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from utils.preprocessing import DATA_DIR, prepare_medals_datasets, load_results
+from utils.country_profiles import MEDAL_TYPES, SESSION_STATUSES, build_country_profiles, session_status
+from utils.schedule_index import PAGE_SIZES, page_slice
+
+# -----------------------------------------------------
+# Page configuration
+# -----------------------------------------------------
+st.set_page_config(page_title="Country Profile", page_icon="🌐", layout="wide")
+st.title("🌐 Country Profile")
+st.markdown("### Everything about one delegation: medals, athletes, teams, coaches, sessions and best results.")
+
+# -----------------------------------------------------
+# Load profile store (built once for every NOC)
+# -----------------------------------------------------
+@st.cache_resource
+def load_country_profiles():
+    medals_total, medallists, medals = prepare_medals_datasets()
+    return build_country_profiles(
+        medals_total,
+        medals,
+        medallists,
+        pd.read_csv(os.path.join(DATA_DIR, "athletes.csv")),
+        pd.read_csv(os.path.join(DATA_DIR, "teams.csv")),
+        pd.read_csv(os.path.join(DATA_DIR, "coaches.csv")),
+        load_results(),
+        pd.read_csv(os.path.join(DATA_DIR, "schedules.csv")),
+    )
+
+profiles = load_country_profiles()
+
+MEDAL_COLORS = {"Gold": "#FFD700", "Silver": "#C0C0C0", "Bronze": "#CD7F32"}
+
+# -----------------------------------------------------
+# Country selection (?noc=FRA links straight to a country)
+# -----------------------------------------------------
+nocs = list(profiles)
+requested = st.query_params.get("noc", "FRA")
+selected_noc = st.selectbox(
+    "Country:",
+    nocs,
+    index=nocs.index(requested) if requested in profiles else 0,
+    format_func=lambda noc: f"{profiles[noc]['summary']['country']} ({noc})",
+)
+st.query_params["noc"] = selected_noc
+
+# Constant-time lookup: every frame below is already split per NOC
+profile = profiles[selected_noc]
+summary = profile["summary"]
+
+st.markdown("---")
+
+# =====================================================
+# 1️⃣ KPIs
+# =====================================================
+st.header(f"🏅 {summary['country']}")
+
+k = st.columns(8)
+k[0].metric("Standing", f"#{summary['standing']}" if summary["standing"] else "—")
+k[1].metric("🥇 Gold", summary["Gold"])
+k[2].metric("🥈 Silver", summary["Silver"])
+k[3].metric("🥉 Bronze", summary["Bronze"])
+k[4].metric("Total", summary["Total"])
+k[5].metric("Athletes", summary["athletes"])
+k[6].metric("Teams", summary["teams"])
+k[7].metric("Disciplines", summary["disciplines"])
+
+st.markdown("---")
+
+# =====================================================
+# 2️⃣ MEDALS
+# =====================================================
+st.header("📊 Medals by Discipline")
+
+by_discipline = profile["medals_by_discipline"]
+if by_discipline.empty:
+    st.info("No medals won.")
+else:
+    left, right = st.columns([3, 2])
+    with left:
+        fig = px.bar(
+            by_discipline,
+            x="discipline",
+            y=MEDAL_TYPES,
+            color_discrete_map=MEDAL_COLORS,
+            labels={"value": "Medals", "variable": "Medal", "discipline": "Discipline"},
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    with right:
+        st.subheader("Medallists")
+        st.dataframe(profile["medallists"], hide_index=True, use_container_width=True)
+
+st.markdown("---")
+
+# =====================================================
+# 3️⃣ DELEGATION & RESULTS
+# =====================================================
+tab1, tab2, tab3, tab4 = st.tabs([
+    "📅 Sessions", "🏆 Best Results", "👥 Teams", "🧑‍🏫 Coaches",
+])
+
+
+# Fragment: paging the sessions reruns only this table
+@st.fragment
+def sessions_section(sessions):
+    if sessions.empty:
+        st.info("No sessions recorded.")
+        return
+
+    # Status is evaluated now, not when the profiles were cached
+    sessions = session_status(sessions)
+
+    c1, c2, c3 = st.columns([2, 1, 1])
+    status = c1.radio("Show:", ["All"] + SESSION_STATUSES, horizontal=True)
+    if status != "All":
+        sessions = sessions[sessions["status"] == status]
+    page_size = c2.selectbox("Rows per page:", PAGE_SIZES, key="sessions_page_size")
+    n_pages = max(1, -(-len(sessions) // page_size))
+    page = c3.number_input(f"Page (of {n_pages:,}):", min_value=1, max_value=n_pages)
+
+    st.caption(f"{len(sessions):,} sessions")
+    st.dataframe(page_slice(sessions, page, page_size), hide_index=True, use_container_width=True)
+
+
+with tab1:
+    sessions_section(profile["sessions"])
+
+with tab2:
+    if profile["best_results"].empty:
+        st.info("No ranked results recorded.")
+    else:
+        st.dataframe(profile["best_results"], hide_index=True, use_container_width=True)
+
+with tab3:
+    st.dataframe(profile["teams"], hide_index=True, use_container_width=True)
+
+with tab4:
+    st.dataframe(profile["coaches"], hide_index=True, use_container_width=True)
@@ -0,0 +1,120 @@
+import streamlit as st
+import plotly.express as px
+
+from utils.preprocessing import load_results
+from utils.progression import (
+    build_progression_index,
+    event_rounds,
+    event_participants,
+    participant_path,
+)
+
+# -----------------------------------------------------
+# Page configuration
+# -----------------------------------------------------
+st.set_page_config(page_title="Road to the Final", page_icon="🏁", layout="wide")
+st.title("🏁 Road to the Final")
+st.markdown("### Follow how athletes and teams advanced from heats and group stages to the final.")
+
+# -----------------------------------------------------
+# Load progression index (built once)
+# -----------------------------------------------------
+@st.cache_resource
+def load_progression():
+    return build_progression_index(load_results())
+
+progression = load_progression()
+rounds = progression["rounds"]
+
+# -----------------------------------------------------
+# Event selection
+# -----------------------------------------------------
+c1, c2 = st.columns(2)
+
+disciplines = sorted(rounds["discipline_name"].dropna().unique())
+selected_discipline = c1.selectbox("Discipline:", disciplines)
+
+discipline_events = (
+    rounds[rounds["discipline_name"] == selected_discipline]
+    .drop_duplicates("event_code")
+    .sort_values("event_name")
+)
+event_labels = dict(zip(discipline_events["event_code"], discipline_events["event_name"]))
+selected_event = c2.selectbox(
+    "Event:", list(event_labels), format_func=lambda code: event_labels[code]
+)
+
+df_rounds = event_rounds(progression, selected_event)
+
+st.markdown("---")
+
+# =====================================================
+# 1️⃣ EVENT ROUNDS
+# =====================================================
+st.header("🪜 Competition Rounds")
+
+left, right = st.columns([2, 3])
+
+with left:
+    st.dataframe(
+        df_rounds[["round_order", "round", "n_stages", "n_participants"]],
+        hide_index=True,
+        use_container_width=True,
+    )
+
+with right:
+    fig = px.funnel(
+        df_rounds,
+        x="n_participants",
+        y="round",
+        title=f"Field size per round — {event_labels[selected_event]}",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+st.markdown("---")
+
+# =====================================================
+# 2️⃣ PARTICIPANT PATH
+# =====================================================
+st.header("🏃 Participant Path")
+
+# Fragment: switching participant reruns only the path, not the rounds above
+@st.fragment
+def participant_path_section(progression, selected_event):
+    entries = event_participants(progression, selected_event)
+    entry_labels = dict(zip(
+        entries["participant_code"],
+        entries["participant_name"] + " (" + entries["participant_country_code"].fillna("") + ")",
+    ))
+
+    selected_participant = st.selectbox(
+        "Choose a participant (furthest round first):",
+        list(entry_labels),
+        format_func=lambda code: entry_labels[code],
+    )
+
+    if selected_participant:
+        path = participant_path(progression, selected_participant, selected_event)
+
+        furthest = path["round"].iloc[-1]
+        st.subheader(f"{entry_labels[selected_participant]} — reached: {furthest}")
+
+        path_ranks = path.dropna(subset=["rank"])
+        if not path_ranks.empty:
+            fig = px.line(
+                path_ranks,
+                x="round",
+                y="rank",
+                markers=True,
+                hover_data=["stage", "result", "qualification_mark"],
+                title="Rank in each round",
+            )
+            fig.update_yaxes(autorange="reversed")
+            st.plotly_chart(fig, use_container_width=True)
+
+        show_cols = ["round", "stage", "date", "rank", "result", "result_IRM", "qualification_mark", "advanced"]
+        st.dataframe(path[show_cols], hide_index=True, use_container_width=True)
+    else:
+        st.info("No participants recorded for this event.")
+
+participant_path_section(progression, selected_event)
@@ -3,7 +3,13 @@ import pandas as pd
 import plotly.express as px
 
 from utils.preprocessing import prepare_medals_datasets
-from utils.filters import global_filters, apply_global_filters
+from utils.filters import global_filters, apply_global_filters, filters_are_default
+from utils.shared_data import cache_frames
+from utils import sql_backend, tab_cache
+from utils.hierarchy import MAX_NODES, DRILL_DEPTH, build_hierarchy, drill_nodes, drill_path_controls
+from utils.views import load_views
+from utils.aggregations import aggregate_sport_country, filter_schedule_by_sport, aggregate_venue_durations
+from utils.schedule_index import PAGE_SIZES, build_schedule_index, day_window, page_slice
 
 # -----------------------------------------------------
 # Page configuration
@@ -15,7 +21,11 @@ st.markdown("### Explore event timelines, medal distribution by sport, and venue
 # -----------------------------------------------------
 # Load core datasets
 # -----------------------------------------------------
-@st.cache_data
+@cache_frames("medals")
+def load_medal_data():
+    return prepare_medals_datasets()
+
+@cache_frames("sports_extra")
 def load_additional_data():
     import os
     DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
@@ -25,60 +35,99 @@ def load_additional_data():
     venues = pd.read_csv(f"{DATA_DIR}/venues.csv")
     return events, schedule, venues
 
-df_medals_total, df_medallists, df_medals = prepare_medals_datasets()
+@st.cache_resource
+def load_schedule_index():
+    _, schedule, _ = load_additional_data()
+    return build_schedule_index(schedule)
+
+df_medals_total, df_medallists, df_medals = load_medal_data()
 events, schedule, venues = load_additional_data()
+schedule_index = load_schedule_index()
 
 # -----------------------------------------------------
 # Apply GLOBAL filters from sidebar
 # -----------------------------------------------------
 filters = global_filters(df_medallists)
-df_filtered_medals = apply_global_filters(df_medallists, filters)
+use_sql = sql_backend.use_sql_backend()
+
+# Default filters: serve the deploy-time materialized views when available
+views = load_views("sports_events") if filters_are_default(filters, df_medallists) else None
+
+# Frames behind the treemap and venue tabs, computed on demand (utils/tab_cache.py)
+if use_sql:
+    tab_frames = {
+        "treemap": lambda: sql_backend.sport_country_counts(filters),
+        "venue_intensity": lambda: sql_backend.venue_durations(
+            filters["selected_sports"] if filters["sport_col"] else None
+        ),
+    }
+else:
+    tab_frames = {
+        "treemap": lambda: aggregate_sport_country(apply_global_filters(df_medallists, filters), events),
+        "venue_intensity": lambda: aggregate_venue_durations(filter_schedule_by_sport(schedule, events, filters)),
+    }
 
-# -----------------------------------------------------
-# Prepare EVENT-related filtered data
-# -----------------------------------------------------
-# Merge schedule with event table to get sport
-schedule_merged = schedule.merge(events[['event', 'sport']], on='event', how='left')
 
-# Filter by selected sports (global filter)
-if filters["sport_col"] and filters["selected_sports"]:
-    schedule_filtered = schedule_merged[schedule_merged["sport"].isin(filters["selected_sports"])]
-else:
-    schedule_filtered = schedule_merged.copy()
+TREEMAP_LEVELS = ["sport", "country"]
+tab_frames["treemap_tree"] = lambda: build_hierarchy(tab_frame("treemap"), TREEMAP_LEVELS, "Total Medals")
+
+
+def tab_frame(name):
+    if views is not None and name in views:
+        return views[name]
+    return tab_cache.get_frame("sports_events", name, filters, tab_frames[name])
+
 
 st.markdown("---")
+# on_change="rerun" makes tabs lazy: only the open tab's block runs
 tab1, tab2, tab3 = st.tabs([
     "🗓️ Event Calendar (Gantt)",
     "🥇 Medals by Sport (Treemap)",
     "🏟️ Venue Usage Intensity"
-])
+], key="sports_events_tab", on_change="rerun")
 
 # =====================================================
 # 1️⃣ EVENT CALENDAR (GANTT CHART)
 # =====================================================
-with tab1:
-    st.header("🗓️ Event Calendar Timeline")
-    st.markdown("Events are colored by **sport**. Filter sports using the global sidebar.")
+# Fragment: sport, day window and page controls rerun only the timeline
+@st.fragment
+def event_calendar_section(schedule_index, filters):
+    if filters["sport_col"] and filters["selected_sports"]:
+        available_sports = [sp for sp in schedule_index if sp in filters["selected_sports"]]
+    else:
+        available_sports = list(schedule_index)
 
-    available_sports = sorted(schedule_filtered["sport"].dropna().unique())
     if available_sports:
-        selected_sport = st.selectbox("Select a sport:", available_sports)
-        df_gantt = schedule_filtered[schedule_filtered["sport"] == selected_sport].copy()
+        selected_sport = st.selectbox("Select a sport:", sorted(available_sports))
+        df_sport = schedule_index[selected_sport]
+
+        # Time window, then one page of sessions: the figure never exceeds a page
+        days = list(dict.fromkeys(df_sport["day"]))
+        if len(days) > 1:
+            first_day, last_day = st.select_slider(
+                "Competition days:", options=days, value=(days[0], days[-1])
+            )
+        else:
+            first_day = last_day = days[0]
+        df_window = day_window(df_sport, first_day, last_day)
 
-        df_gantt = df_gantt.dropna(subset=["start_date", "end_date"])
-        df_gantt["start_date"] = pd.to_datetime(df_gantt["start_date"])
-        df_gantt["end_date"] = pd.to_datetime(df_gantt["end_date"])
+        c1, c2 = st.columns(2)
+        page_size = c1.selectbox("Sessions per page:", PAGE_SIZES)
+        n_pages = max(1, -(-len(df_window) // page_size))
+        page = c2.number_input(f"Page (of {n_pages}):", min_value=1, max_value=n_pages, value=1)
 
-        if not df_gantt.empty:
-            df_gantt = df_gantt.sort_values("start_date")
+        df_gantt = page_slice(df_window, page, page_size)
 
+        if not df_gantt.empty:
+            first = (page - 1) * page_size + 1
             fig = px.timeline(
                 df_gantt,
                 x_start="start_date",
                 x_end="end_date",
                 y="event",
                 color="sport",
-                title=f"Event Timeline for {selected_sport}",
+                title=f"Event Timeline for {selected_sport} "
+                      f"(sessions {first}–{first + len(df_gantt) - 1} of {len(df_window)})",
                 color_discrete_sequence=px.colors.qualitative.Bold,
             )
 
@@ -87,72 +136,83 @@ with tab1:
 
             st.subheader("Event Details")
             show_cols = ["event", "sport", "start_date", "end_date", "venue"]
-            st.dataframe(df_gantt[show_cols].sort_values("start_date"))
+            st.dataframe(df_gantt[show_cols], hide_index=True)
         else:
             st.info("No valid schedule entries for this sport.")
     else:
         st.warning("No sports available for the current global filters.")
 
+with tab1:
+    if tab1.open:
+        st.header("🗓️ Event Calendar Timeline")
+        st.markdown("Events are colored by **sport**. Filter sports using the global sidebar.")
+
+        event_calendar_section(schedule_index, filters)
+
 
 # =====================================================
 # 2️⃣ MEDALS BY SPORT (TREEMAP)
 # =====================================================
-with tab2:
-    st.header("🥇 Medal Distribution by Sport and Country")
-
-    # Merge medals with event info to get sport
-    medal_events = df_filtered_medals.merge(events[['event', 'sport']], on='event', how='left')
+# Only DRILL_DEPTH levels below the drill path are sent to the browser;
+# drilling reruns just this fragment
+@st.fragment
+def treemap_section(hierarchy):
+    c1, c2 = st.columns([4, 1])
+    with c1:
+        path = drill_path_controls(hierarchy, key="treemap_drill")
+    max_nodes = c2.number_input("Max tiles:", 20, 1000, MAX_NODES, step=20, key="treemap_max_nodes")
+
+    nodes = drill_nodes(hierarchy, path, DRILL_DEPTH, max_nodes, root_label="Medals")
+    fig = px.treemap(
+        nodes,
+        ids="id",
+        names="label",
+        parents="parent",
+        values="value",
+        color="value",
+        color_continuous_scale="Turbo",
+        branchvalues="total",
+        title="Hierarchical Medal Distribution",
+    )
+    st.plotly_chart(fig, use_container_width=True)
 
-    if "sport" not in medal_events.columns:
-        st.error("Missing sport information. Cannot build treemap.")
-    else:
-        df_treemap = medal_events.groupby(["sport", "country"]).size().reset_index(name="Total Medals")
+with tab2:
+    if tab2.open:
+        st.header("🥇 Medal Distribution by Sport and Country")
 
-        if df_treemap.empty:
+        if tab_frame("treemap").empty:
             st.info("No medal data available for selected filters.")
         else:
-            fig = px.treemap(
-                df_treemap,
-                path=[px.Constant("Medals"), "sport", "country"],
-                values="Total Medals",
-                color="Total Medals",
-                color_continuous_scale="Turbo",
-                title="Hierarchical Medal Distribution",
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            treemap_section(tab_frame("treemap_tree"))
 
 # =====================================================
 # 3️⃣ VENUE USAGE INTENSITY (BAR CHART)
 # =====================================================
 with tab3:
-    st.header("🏟️ Venue Usage Intensity (Total Event Duration)")
+    if tab3.open:
+        st.header("🏟️ Venue Usage Intensity (Total Event Duration)")
 
-    df_duration = schedule_filtered.copy()
+        try:
+            venue_intensity = tab_frame("venue_intensity")
+        except ValueError:  # pandas date parse errors subclass ValueError
+            st.error("Date parsing failed for schedules.csv.")
+            st.stop()
 
-    try:
-        df_duration["start_date"] = pd.to_datetime(df_duration["start_date"])
-        df_duration["end_date"] = pd.to_datetime(df_duration["end_date"])
-    except:
-        st.error("Date parsing failed for schedules.csv.")
-        st.stop()
-
-    df_duration["duration_days"] = (df_duration["end_date"] - df_duration["start_date"]).dt.total_seconds() / (24 * 3600)
-
-    venue_intensity = df_duration.groupby("venue")["duration_days"].sum().reset_index()
-    venue_intensity["duration_days"] = venue_intensity["duration_days"].round(2)
-    venue_intensity = venue_intensity.sort_values("duration_days", ascending=False)
+        if venue_intensity.empty:
+            st.info("No event duration data available.")
+        else:
+            fig = px.bar(
+                venue_intensity,
+                x="duration_days",
+                y="venue",
+                orientation="h",
+                color="duration_days",
+                color_continuous_scale="Sunset",
+                title="Total Event Duration per Venue"
+            )
+            fig.update_yaxes(autorange="reversed")
+            st.plotly_chart(fig, use_container_width=True)
 
-    if venue_intensity.empty:
-        st.info("No event duration data available.")
-    else:
-        fig = px.bar(
-            venue_intensity,
-            x="duration_days",
-            y="venue",
-            orientation="h",
-            color="duration_days",
-            color_continuous_scale="Sunset",
-            title="Total Event Duration per Venue"
-        )
-        fig.update_yaxes(autorange="reversed")
-        st.plotly_chart(fig, use_container_width=True)
+# Compute the other tabs' frames in the background for the next tab switch
+if views is None:
+    tab_cache.prewarm("sports_events", tab_frames, filters)
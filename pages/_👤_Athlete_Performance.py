@@ -4,6 +4,11 @@ import plotly.express as px
 import datetime
 import os
 
+from utils.leaderboard import build_leaderboard, top_n
+from utils.shared_data import cache_frames
+from utils.views import load_views
+from utils.aggregations import aggregate_athlete_medals, aggregate_gender_counts
+
 # ------------------------------------
 # Page Setup
 # ------------------------------------
@@ -34,12 +39,18 @@ def load_image():
 ROOT = os.path.dirname(os.path.dirname(__file__))
 DATA_DIR = os.path.join(ROOT, "data")
 
-athletes_df = pd.read_csv(os.path.join(DATA_DIR, "athletes.csv"))
-coaches_df = pd.read_csv(os.path.join(DATA_DIR, "coaches.csv"))
-teams_df = pd.read_csv(os.path.join(DATA_DIR, "teams.csv"))
-medals_df = pd.read_csv(os.path.join(DATA_DIR, "medals.csv"))
-nocs_df = pd.read_csv(os.path.join(DATA_DIR, "nocs.csv"))
-medals_total_df = pd.read_csv(os.path.join(DATA_DIR, "medals_total.csv"))
+@cache_frames("athlete_page")
+def load_data():
+    return (
+        pd.read_csv(os.path.join(DATA_DIR, "athletes.csv")),
+        pd.read_csv(os.path.join(DATA_DIR, "coaches.csv")),
+        pd.read_csv(os.path.join(DATA_DIR, "teams.csv")),
+        pd.read_csv(os.path.join(DATA_DIR, "medals.csv")),
+        pd.read_csv(os.path.join(DATA_DIR, "nocs.csv")),
+        pd.read_csv(os.path.join(DATA_DIR, "medals_total.csv")),
+    )
+
+athletes_df, coaches_df, teams_df, medals_df, nocs_df, medals_total_df = load_data()
 
 # ------------------------------------
 # Continent Mapping
@@ -57,6 +68,17 @@ continent_map = {
 athletes_df["continent"] = athletes_df["country_code"].map(continent_map).fillna("Other")
 medals_total_df["continent"] = medals_total_df["country_code"].map(continent_map).fillna("Other")
 
+@st.cache_resource
+def load_leaderboard(medals_total):
+    counts = medals_total.rename(columns={
+        "Gold Medal": "Gold",
+        "Silver Medal": "Silver",
+        "Bronze Medal": "Bronze",
+    })
+    return build_leaderboard(counts)
+
+leaderboard = load_leaderboard(medals_total_df)
+
 # ------------------------------------
 # Clean Athletes Age
 # ------------------------------------
@@ -69,163 +91,187 @@ athletes_df["age"] = athletes_df["birth_date"].apply(
 )
 athletes_df = athletes_df.dropna(subset=["age"])
 
+# The page has no sidebar filters: serve the deploy-time materialized views
+# when available
+views = load_views("athlete_performance")
+
 # ------------------------------------
 # Medal Count per Athlete
 # ------------------------------------
-medal_counts = medals_df.groupby("name").size().reset_index(name="total_medals")
+medal_counts = views["medal_counts"] if views is not None else aggregate_athlete_medals(medals_df)
 
 # ------------------------------------
 # UI Layout
 # ------------------------------------
+# Each section is an st.fragment: its widgets rerun only that section,
+# not the data loading above or the other charts.
 st.title("🏅 Athlete Performance Dashboard")
 st.markdown("---")
 
 # ======================================================
 # 1️⃣ Athlete Profile Card
 # ======================================================
-st.markdown('<div class="section-header"><h2>🎖 Athlete Profile</h2></div>', unsafe_allow_html=True)
+@st.fragment
+def athlete_profile_section(athletes_df):
+    st.markdown('<div class="section-header"><h2>🎖 Athlete Profile</h2></div>', unsafe_allow_html=True)
 
-# Remove invalid numeric names like "671"
-athlete_list = [
-    name for name in athletes_df["name"].dropna().unique()
-    if isinstance(name, str) and not name.isdigit()
-]
+    # Remove invalid numeric names like "671"
+    athlete_list = [
+        name for name in athletes_df["name"].dropna().unique()
+        if isinstance(name, str) and not name.isdigit()
+    ]
 
-athlete_list = sorted(athlete_list)
+    athlete_list = sorted(athlete_list)
 
-selected_athlete = st.selectbox("🔍 Select an Athlete:", [""] + athlete_list)
+    selected_athlete = st.selectbox("🔍 Select an Athlete:", [""] + athlete_list)
 
-if selected_athlete:
-    row = athletes_df[athletes_df["name"] == selected_athlete].iloc[0]
+    if selected_athlete:
+        row = athletes_df[athletes_df["name"] == selected_athlete].iloc[0]
 
-    col1, col2 = st.columns([1, 3])
-    with col1:
-        st.markdown(f"<h1 style='text-align:center;font-size:120px'>{load_image()}</h1>", unsafe_allow_html=True)
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            st.markdown(f"<h1 style='text-align:center;font-size:120px'>{load_image()}</h1>", unsafe_allow_html=True)
 
-    with col2:
-        st.subheader(row["name"])
-        flag = get_flag_emoji(row["country_code"])
-        st.markdown(f"**Country:** {row['country']} ({row['country_code']}) {flag}")
-        st.markdown(f"**Height / Weight:** {row.get('height', 'N/A')} cm / {row.get('weight','N/A')} kg")
-        st.markdown(f"**Coach:** {row.get('coach','N/A')}")
-        st.markdown(f"**Discipline:** {row.get('discipline','N/A')}")
+        with col2:
+            st.subheader(row["name"])
+            flag = get_flag_emoji(row["country_code"])
+            st.markdown(f"**Country:** {row['country']} ({row['country_code']}) {flag}")
+            st.markdown(f"**Height / Weight:** {row.get('height', 'N/A')} cm / {row.get('weight','N/A')} kg")
+            st.markdown(f"**Coach:** {row.get('coach','N/A')}")
+            st.markdown(f"**Discipline:** {row.get('discipline','N/A')}")
 
+athlete_profile_section(athletes_df)
 st.markdown("---")
 
 # ======================================================
 # 2️⃣ Age Distribution
 # ======================================================
-st.markdown('<div class="section-header"><h2>📊 Age Distribution</h2></div>', unsafe_allow_html=True)
+@st.fragment
+def age_distribution_section(athletes_df):
+    st.markdown('<div class="section-header"><h2>📊 Age Distribution</h2></div>', unsafe_allow_html=True)
 
-group_choice = st.selectbox("Group Age By:", ["Gender", "Discipline", "Country"])
+    group_choice = st.selectbox("Group Age By:", ["Gender", "Discipline", "Country"])
 
-df_plot = athletes_df.copy()
-if group_choice == "Gender":
-    group_col = "gender"
-elif group_choice == "Discipline":
-    group_col = "discipline"
-elif group_choice == "Country":
-    group_col = "country"
+    df_plot = athletes_df
+    if group_choice == "Gender":
+        group_col = "gender"
+    elif group_choice == "Discipline":
+        group_col = "discipline"
+    elif group_choice == "Country":
+        group_col = "country"
 
-fig = px.violin(df_plot, x=group_col, y="age", box=True, points="all")
-st.plotly_chart(fig, use_container_width=True)
+    fig = px.violin(df_plot, x=group_col, y="age", box=True, points="all")
+    st.plotly_chart(fig, use_container_width=True)
 
-summary = df_plot.groupby(group_col)["age"].agg(["count", "mean", "median"]).round(1)
-st.dataframe(summary, use_container_width=True)
+    summary = df_plot.groupby(group_col)["age"].agg(["count", "mean", "median"]).round(1)
+    st.dataframe(summary, use_container_width=True)
 
+age_distribution_section(athletes_df)
 st.markdown("---")
 
 # ======================================================
 # 3️⃣ Gender Distribution
 # ======================================================
-st.markdown('<div class="section-header"><h2>🧍 Gender Distribution</h2></div>', unsafe_allow_html=True)
+@st.fragment
+def gender_distribution_section(athletes_df, worldwide_counts=None):
+    st.markdown('<div class="section-header"><h2>🧍 Gender Distribution</h2></div>', unsafe_allow_html=True)
 
-scope = st.selectbox("Filter:", ["Worldwide", "By Continent", "By Country"])
+    scope = st.selectbox("Filter:", ["Worldwide", "By Continent", "By Country"])
 
-df_gender = athletes_df.copy()
-title_suffix = ""
+    df_gender = athletes_df
+    title_suffix = ""
 
-if scope == "By Continent":
-    c = st.selectbox("Select Continent:", sorted(df_gender["continent"].unique()))
-    df_gender = df_gender[df_gender["continent"] == c]
-    title_suffix = f" in {c}"
+    if scope == "By Continent":
+        c = st.selectbox("Select Continent:", sorted(df_gender["continent"].unique()))
+        df_gender = df_gender[df_gender["continent"] == c]
+        title_suffix = f" in {c}"
 
-elif scope == "By Country":
-    c = st.selectbox("Select Country:", sorted(df_gender["country"].unique()))
-    df_gender = df_gender[df_gender["country"] == c]
-    title_suffix = f" in {c}"
+    elif scope == "By Country":
+        c = st.selectbox("Select Country:", sorted(df_gender["country"].unique()))
+        df_gender = df_gender[df_gender["country"] == c]
+        title_suffix = f" in {c}"
 
-gender_counts = df_gender["gender"].value_counts().reset_index()
-gender_counts.columns = ["gender", "count"]
+    if scope == "Worldwide" and worldwide_counts is not None:
+        gender_counts = worldwide_counts
+    else:
+        gender_counts = aggregate_gender_counts(df_gender)
 
-pie = px.pie(gender_counts, names="gender", values="count", title="Gender Distribution" + title_suffix)
-bar = px.bar(gender_counts, x="gender", y="count")
+    pie = px.pie(gender_counts, names="gender", values="count", title="Gender Distribution" + title_suffix)
+    bar = px.bar(gender_counts, x="gender", y="count")
 
-col1, col2 = st.columns(2)
-col1.plotly_chart(pie, use_container_width=True)
-col2.plotly_chart(bar, use_container_width=True)
+    col1, col2 = st.columns(2)
+    col1.plotly_chart(pie, use_container_width=True)
+    col2.plotly_chart(bar, use_container_width=True)
 
-st.dataframe(gender_counts)
+    st.dataframe(gender_counts)
 
+gender_distribution_section(athletes_df, views["gender_counts"] if views is not None else None)
 st.markdown("---")
 
 # ======================================================
 # 4️⃣ Top Athletes by Medals
 # ======================================================
-st.markdown('<div class="section-header"><h2>🥇 Top Athletes by Medal Count</h2></div>', unsafe_allow_html=True)
+@st.fragment
+def top_athletes_section(medal_counts):
+    st.markdown('<div class="section-header"><h2>🥇 Top Athletes by Medal Count</h2></div>', unsafe_allow_html=True)
 
-n = st.slider("How many athletes?", 5, 20, 10)
-top_athletes = medal_counts.nlargest(n, "total_medals")
+    n = st.slider("How many athletes?", 5, 20, 10)
+    top_athletes = medal_counts.nlargest(n, "total_medals")
 
-fig_top = px.bar(top_athletes, x="name", y="total_medals", color="total_medals")
-st.plotly_chart(fig_top, use_container_width=True)
-st.dataframe(top_athletes)
+    fig_top = px.bar(top_athletes, x="name", y="total_medals", color="total_medals")
+    st.plotly_chart(fig_top, use_container_width=True)
+    st.dataframe(top_athletes)
 
+top_athletes_section(medal_counts)
 st.markdown("---")
 
 # ======================================================
 # 5️⃣ Top Countries by Continent
 # ======================================================
-st.markdown('<div class="section-header"><h2>🌍 Top Performing Countries</h2></div>', unsafe_allow_html=True)
+@st.fragment
+def top_countries_section(leaderboard, continents):
+    st.markdown('<div class="section-header"><h2>🌍 Top Performing Countries</h2></div>', unsafe_allow_html=True)
 
-continent = st.selectbox("Select Continent:", sorted(medals_total_df["continent"].unique()))
-ranking = st.radio("Rank by:", ["Total", "Gold", "Silver", "Bronze"])
+    continent = st.selectbox("Select Continent:", continents)
+    ranking = st.radio("Rank by:", ["Total", "Gold", "Silver", "Bronze"])
 
-ranking_col = ranking
-df_cont = medals_total_df[medals_total_df["continent"] == continent]
-df_sorted = df_cont.nlargest(10, ranking)
+    ranking_col = ranking
+    df_sorted = top_n(leaderboard, ranking.lower(), 10, continent=continent)
 
-fig = px.bar(df_sorted, x="country", y=ranking_col, title=f"Top Countries in {continent}")
-st.plotly_chart(fig, use_container_width=True)
+    fig = px.bar(df_sorted, x="country", y=ranking_col, title=f"Top Countries in {continent}")
+    st.plotly_chart(fig, use_container_width=True)
 
+top_countries_section(leaderboard, sorted(medals_total_df["continent"].unique()))
 st.markdown("---")
 
 # ======================================================
 # 6️⃣ Medal World Map by Type
 # ======================================================
-st.markdown('<div class="section-header"><h2>🗺️ Global Medal Distribution</h2></div>', unsafe_allow_html=True)
-
-# User selects Gold / Silver / Bronze (UI)
-medal_type = st.selectbox("Medal Type:", ["Gold", "Silver", "Bronze"])
-
-# Map UI label → actual column name in CSV
-real_col_map = {
-    "Gold": "Gold Medal",
-    "Silver": "Silver Medal",
-    "Bronze": "Bronze Medal",
-}
-
-color_col = real_col_map[medal_type]  # <-- FIX HERE
+@st.fragment
+def medal_map_section(medals_total_df):
+    st.markdown('<div class="section-header"><h2>🗺️ Global Medal Distribution</h2></div>', unsafe_allow_html=True)
+
+    # User selects Gold / Silver / Bronze (UI)
+    medal_type = st.selectbox("Medal Type:", ["Gold", "Silver", "Bronze"])
+
+    # Map UI label → actual column name in CSV
+    real_col_map = {
+        "Gold": "Gold Medal",
+        "Silver": "Silver Medal",
+        "Bronze": "Bronze Medal",
+    }
 
-fig_map = px.choropleth(
-    medals_total_df,
-    locations="country_code",
-    locationmode="ISO-3",
-    color=color_col,   # <-- MUST use real CSV column
-    title=f"{medal_type} Medal Distribution",
-    color_continuous_scale="YlOrBr",
-)
+    color_col = real_col_map[medal_type]  # <-- FIX HERE
 
-st.plotly_chart(fig_map, use_container_width=True)
+    fig_map = px.choropleth(
+        medals_total_df,
+        locations="country_code",
+        locationmode="ISO-3",
+        color=color_col,   # <-- MUST use real CSV column
+        title=f"{medal_type} Medal Distribution",
+        color_continuous_scale="YlOrBr",
+    )
 
+    st.plotly_chart(fig_map, use_container_width=True)
 
+medal_map_section(medals_total_df)
@@ -0,0 +1,93 @@
+import plotly.express as px
+import streamlit as st
+
+from utils.schedule_changes import CHANGE_TYPES, change_summary, schedule_changes
+from utils.schedule_index import PAGE_SIZES, page_slice
+
+# -----------------------------------------------------
+# Page configuration
+# -----------------------------------------------------
+st.set_page_config(page_title="Schedule Changes", page_icon="🔄", layout="wide")
+st.title("🔄 Schedule Changes")
+st.markdown("### Sessions moved, added or cancelled between the preliminary and the final schedule.")
+
+REFRESH_SECONDS = 30
+ALL = "All"
+CHANGE_COLORS = {"unchanged": "#9E9E9E", "within": "#BDBDBD", "moved": "#FFA726", "added": "#66BB6A", "cancelled": "#EF5350"}
+
+auto_refresh = st.toggle(f"Check the schedule files every {REFRESH_SECONDS} s")
+
+
+# Fragment: a refresh re-reads only changed files and re-diffs only changed
+# (venue, discipline) partitions; the rest of the page is not rerun
+@st.fragment(run_every=REFRESH_SECONDS if auto_refresh else None)
+def change_log_section():
+    log, runs = schedule_changes()
+
+    # =====================================================
+    # 1️⃣ KPIs (delta: since the previous reconciliation)
+    # =====================================================
+    last = runs.iloc[-1]
+    previous = runs.iloc[-2] if len(runs) > 1 else last
+    k = st.columns(len(CHANGE_TYPES))
+    for col, change in zip(k, CHANGE_TYPES):
+        col.metric(change.capitalize(), f"{last[change]:,}", delta=int(last[change] - previous[change]) or None)
+    st.caption(f"Last reconciled {last['time']:%Y-%m-%d %H:%M:%S} UTC — "
+               f"{last['rediffed']} of {last['partitions']} venue/discipline pairs diffed")
+
+    st.markdown("---")
+
+    # =====================================================
+    # 2️⃣ CHURN PER VENUE
+    # =====================================================
+    st.header("🏟️ Changes per Venue")
+
+    changed = log[~log["change"].isin(["unchanged", "within"])]
+    if changed.empty:
+        st.info("The final schedule matches the preliminary one.")
+    else:
+        per_venue = changed.groupby(["venue", "change"]).size().reset_index(name="sessions")
+        fig = px.bar(
+            per_venue,
+            x="venue",
+            y="sessions",
+            color="change",
+            color_discrete_map=CHANGE_COLORS,
+            category_orders={"change": CHANGE_TYPES},
+        )
+        fig.update_layout(xaxis_title=None, xaxis_tickangle=-45)
+        st.plotly_chart(fig, use_container_width=True)
+
+        with st.expander("Per venue and discipline"):
+            st.dataframe(change_summary(log), hide_index=True, use_container_width=True)
+
+    st.markdown("---")
+
+    # =====================================================
+    # 3️⃣ CHANGE LOG
+    # =====================================================
+    st.header("📝 Change Log")
+
+    c1, c2, c3 = st.columns([2, 2, 2])
+    changes = c1.multiselect("Change:", CHANGE_TYPES, default=["moved", "added", "cancelled"])
+    venue = c2.selectbox("Venue:", [ALL] + sorted(v for v in log["venue"].unique() if v))
+    discipline = c3.selectbox("Discipline:", [ALL] + sorted(log["discipline"].unique()))
+
+    view = log[log["change"].isin(changes)]
+    if venue != ALL:
+        view = view[view["venue"] == venue]
+    if discipline != ALL:
+        view = view[view["discipline"] == discipline]
+
+    c1, c2 = st.columns([1, 1])
+    page_size = c1.selectbox("Rows per page:", PAGE_SIZES, key="changes_page_size")
+    n_pages = max(1, -(-len(view) // page_size))
+    page = c2.number_input(f"Page (of {n_pages:,}):", min_value=1, max_value=n_pages)
+
+    st.caption(f"{len(view):,} sessions")
+    st.dataframe(page_slice(view, page, page_size), hide_index=True, use_container_width=True)
+
+    with st.expander("Reconciliation runs"):
+        st.dataframe(runs, hide_index=True, use_container_width=True)
+
+change_log_section()
@@ -0,0 +1,74 @@
+import streamlit as st
+
+from utils.preprocessing import load_results
+from utils.schedule_index import PAGE_SIZES
+from utils.results_index import SORT_KEYS, build_results_index, query_results
+
+# -----------------------------------------------------
+# Page configuration
+# -----------------------------------------------------
+st.set_page_config(page_title="Results Explorer", page_icon="🔎", layout="wide")
+st.title("🔎 Results Explorer")
+st.markdown("### Browse every result row: filter, search and sort on the server, one page at a time.")
+
+# -----------------------------------------------------
+# Load results index (built once)
+# -----------------------------------------------------
+@st.cache_resource
+def load_results_index():
+    return build_results_index(load_results())
+
+index = load_results_index()
+
+SORT_LABELS = {
+    "date": "Date",
+    "discipline": "Discipline",
+    "event": "Event",
+    "noc": "NOC",
+    "rank": "Rank",
+}
+ALL = "All"
+
+
+def reset_page():
+    st.session_state["results_page"] = 1
+
+
+# -----------------------------------------------------
+# Controls
+# -----------------------------------------------------
+c1, c2, c3 = st.columns([2, 1, 3])
+discipline = c1.selectbox("Discipline:", [ALL] + index["disciplines"], on_change=reset_page)
+noc = c2.selectbox("NOC:", [ALL] + index["nocs"], on_change=reset_page)
+search = c3.text_input("Search (athlete, team, country, event):", on_change=reset_page)
+
+c1, c2, c3 = st.columns([2, 1, 1])
+sort = c1.selectbox("Sort by:", list(SORT_KEYS), format_func=SORT_LABELS.get, on_change=reset_page)
+descending = c2.toggle("Descending", on_change=reset_page)
+page_size = c3.selectbox("Rows per page:", PAGE_SIZES, on_change=reset_page)
+
+# -----------------------------------------------------
+# One page of rows
+# -----------------------------------------------------
+# Only this page is materialized and sent to the browser
+page = st.session_state.get("results_page", 1)
+df_page, total = query_results(
+    index,
+    sort=sort,
+    descending=descending,
+    discipline=None if discipline == ALL else discipline,
+    noc=None if noc == ALL else noc,
+    search=search,
+    page=page,
+    page_size=page_size,
+)
+
+n_pages = max(1, -(-total // page_size))
+if total == 0:
+    st.info("No results match the current filters.")
+else:
+    first = (page - 1) * page_size + 1
+    st.caption(f"Rows {first:,}–{first + len(df_page) - 1:,} of {total:,}")
+    st.dataframe(df_page, hide_index=True, use_container_width=True)
+
+st.number_input(f"Page (of {n_pages:,}):", min_value=1, max_value=n_pages, key="results_page")
@@ -1,9 +1,23 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 
 from utils.preprocessing import prepare_medals_datasets
-from utils.filters import global_filters, apply_global_filters
+from utils.filters import global_filters, apply_global_filters, filters_are_default
+from utils.query import filters_to_params
+from utils.api_client import fetch_frame
+from utils.shared_data import cache_frames
+from utils import sql_backend, tab_cache
+from utils.hierarchy import MAX_NODES, DRILL_DEPTH, build_hierarchy, drill_nodes, drill_path_controls
+from utils.medal_race import MEDAL_TYPES, TOP_N, build_medal_race, medal_rows_filters, race_frames, standings_table
+from utils.views import load_views
+from utils.aggregations import (
+    aggregate_continent_medals,
+    aggregate_sunburst,
+    aggregate_gender_medals,
+    aggregate_top_sports,
+)
 
 
 # -----------------------------------------------------
@@ -28,7 +42,7 @@ MEDAL_COLOR_MAP = {
 # -----------------------------------------------------
 # LOAD DATA
 # -----------------------------------------------------
-@st.cache_data
+@cache_frames("medals")
 def load_data():
     return prepare_medals_datasets()
 
@@ -41,192 +55,293 @@ st.markdown("Explore all global medal insights using the sidebar filters and the
 # FILTER DATA
 # -----------------------------------------------------
 filters = global_filters(df_medallists)
-df_filtered = apply_global_filters(df_medallists, filters)
+use_sql = sql_backend.use_sql_backend()
+
+# Default filters: serve the deploy-time materialized views when available
+views = load_views("global_analysis") if filters_are_default(filters, df_medallists) else None
+
+if views is None:
+    if use_sql:
+        no_data = sql_backend.count_medallists(filters) == 0
+    else:
+        no_data = apply_global_filters(df_medallists, filters).empty
 
-if df_filtered.empty:
-    st.warning("No data matches your filters.")
-    st.stop()
+    if no_data:
+        st.warning("No data matches your filters.")
+        st.stop()
 
 
 # -----------------------------------------------------
 # HELPER AGGREGATION FUNCTIONS
 # -----------------------------------------------------
-def aggregate_country_medals(df):
-    grp = df.groupby(
-        ["country_code", "country_long", "medal_type"]
-    ).size().reset_index(name="count")
+def aggregate_country_medals(filters):
+    # Ranked from the pre-aggregated medal cube (or the shared API service)
+    return fetch_frame("medals", by="country", **filters_to_params(filters))
 
-    pivot = grp.pivot_table(
-        index=["country_code", "country_long"],
-        columns="medal_type",
-        values="count",
-        fill_value=0
-    ).reset_index()
 
-    for m in ["Gold", "Silver", "Bronze"]:
-        if m not in pivot.columns:
-            pivot[m] = 0
+def filtered():
+    return apply_global_filters(df_medallists, filters)
 
-    pivot["Total"] = pivot["Gold"] + pivot["Silver"] + pivot["Bronze"]
-    return pivot.sort_values("Total", ascending=False)
 
+# Frames behind the tabs, computed on demand (see utils/tab_cache.py)
+if use_sql:
+    tab_frames = {
+        "country_medals": lambda: sql_backend.country_medals(filters),
+        "continent_medals": lambda: sql_backend.medal_counts_by(filters, ["continent"]),
+        "sunburst": lambda: sql_backend.sunburst_counts(filters),
+        "gender_medals": lambda: sql_backend.medal_counts_by(filters, ["gender"]),
+        "top_sports": lambda: sql_backend.top_sport_medals(filters, 10),
+    }
+else:
+    has_discipline = "discipline" in df_medallists.columns
+    tab_frames = {
+        "country_medals": lambda: aggregate_country_medals(filters),
+        "continent_medals": lambda: aggregate_continent_medals(filtered()),
+        "sunburst": lambda: aggregate_sunburst(filtered()),
+        "gender_medals": lambda: aggregate_gender_medals(filtered()),
+        "top_sports": lambda: aggregate_top_sports(filtered(), 10) if has_discipline else None,
+    }
 
-def aggregate_continent_medals(df):
-    grp = df.groupby(["continent", "medal_type"]).size().reset_index(name="count")
-    return grp[grp["medal_type"].isin(["Gold", "Silver", "Bronze"])]
 
+SUNBURST_LEVELS = ["continent", "country", "discipline"]
+tab_frames["sunburst_tree"] = lambda: build_hierarchy(tab_frame("sunburst"), SUNBURST_LEVELS)
+tab_frames["medal_race"] = lambda: build_medal_race(apply_global_filters(df_medals, medal_rows_filters(filters)))
 
-def aggregate_sunburst(df):
-    if "discipline" not in df.columns:
-        df["discipline"] = "Unknown"
-    return df.groupby(
-        ["continent", "country", "discipline"]
-    ).size().reset_index(name="count")
 
-
-df_country_medals = aggregate_country_medals(df_filtered)
-df_continent_medals = aggregate_continent_medals(df_filtered)
-df_sunburst = aggregate_sunburst(df_filtered)
+def tab_frame(name):
+    if views is not None and name in views:
+        return views[name]
+    return tab_cache.get_frame("global_analysis", name, filters, tab_frames[name])
 
 
 # -----------------------------------------------------
 # TABS LAYOUT
 # -----------------------------------------------------
-tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+# on_change="rerun" makes tabs lazy: only the open tab's block runs
+tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
     "🌍 World Medal Map",
     "🌞 Medal Hierarchy (Sunburst)",
     "📊 Continent Comparison",
     "🏆 Top 20 Countries",
     "👥 Medals by Gender",
     "🏅 Top 10 Sports",
-])
+    "📈 Medal Race",
+], key="global_analysis_tab", on_change="rerun")
 
 
 # -----------------------------------------------------
 # TAB 1 — Choropleth Map
 # -----------------------------------------------------
 with tab1:
-    st.subheader("🌍 World Medal Map")
-
-    fig_map = px.choropleth(
-        df_country_medals,
-        locations="country_code",
-        color="Total",
-        hover_name="country_long",
-        color_continuous_scale="YlOrBr",
-    )
-    st.plotly_chart(fig_map, use_container_width=True)
+    if tab1.open:
+        st.subheader("🌍 World Medal Map")
+
+        fig_map = px.choropleth(
+            tab_frame("country_medals"),
+            locations="country_code",
+            color="Total",
+            hover_name="country_long",
+            color_continuous_scale="YlOrBr",
+        )
+        st.plotly_chart(fig_map, use_container_width=True)
 
 
 # -----------------------------------------------------
 # TAB 2 — Sunburst
 # -----------------------------------------------------
-with tab2:
-    st.subheader("🌞 Medal Hierarchy by Continent → Country → Sport")
-
+# Only DRILL_DEPTH levels below the drill path are sent to the browser;
+# drilling reruns just this fragment
+@st.fragment
+def sunburst_section(hierarchy):
+    c1, c2 = st.columns([4, 1])
+    with c1:
+        path = drill_path_controls(hierarchy, key="sunburst_drill")
+    max_nodes = c2.number_input("Max segments:", 20, 1000, MAX_NODES, step=20, key="sunburst_max_nodes")
+
+    nodes = drill_nodes(hierarchy, path, DRILL_DEPTH, max_nodes)
     fig_sun = px.sunburst(
-        df_sunburst,
-        path=["continent", "country", "discipline"],
-        values="count",
-        color="continent",
+        nodes,
+        ids="id",
+        names="label",
+        parents="parent",
+        values="value",
+        color="group",
+        branchvalues="total",
     )
     st.plotly_chart(fig_sun, use_container_width=True)
 
 
+with tab2:
+    if tab2.open:
+        st.subheader("🌞 Medal Hierarchy by Continent → Country → Sport")
+        sunburst_section(tab_frame("sunburst_tree"))
+
+
 # -----------------------------------------------------
 # TAB 3 — Continent vs Medal Type
 # -----------------------------------------------------
 with tab3:
-    st.subheader("📊 Medals by Continent and Medal Type")
-
-    fig_cont = px.bar(
-        df_continent_medals,
-        x="continent",
-        y="count",
-        color="medal_type",
-        barmode="group",
-        color_discrete_map=MEDAL_COLOR_MAP,
-    )
-    st.plotly_chart(fig_cont, use_container_width=True)
+    if tab3.open:
+        st.subheader("📊 Medals by Continent and Medal Type")
+
+        fig_cont = px.bar(
+            tab_frame("continent_medals"),
+            x="continent",
+            y="count",
+            color="medal_type",
+            barmode="group",
+            color_discrete_map=MEDAL_COLOR_MAP,
+        )
+        st.plotly_chart(fig_cont, use_container_width=True)
 
 
 # -----------------------------------------------------
 # TAB 4 — Top 20 Countries
 # -----------------------------------------------------
 with tab4:
-    st.subheader("🏆 Top 20 Countries by Total Medals")
-
-    df_top20 = df_country_medals.head(20)
-    df_top20_melt = df_top20.melt(
-        id_vars=["country_long"],
-        value_vars=["Gold", "Silver", "Bronze"],
-        var_name="medal_type",
-        value_name="count",
-    )
+    if tab4.open:
+        st.subheader("🏆 Top 20 Countries by Total Medals")
+
+        df_top20 = tab_frame("country_medals").head(20)
+        df_top20_melt = df_top20.melt(
+            id_vars=["country_long"],
+            value_vars=["Gold", "Silver", "Bronze"],
+            var_name="medal_type",
+            value_name="count",
+        )
 
-    fig_top20 = px.bar(
-        df_top20_melt,
-        x="country_long",
-        y="count",
-        color="medal_type",
-        barmode="group",
-        color_discrete_map=MEDAL_COLOR_MAP,
-    )
-    fig_top20.update_layout(xaxis_tickangle=-45)
-    st.plotly_chart(fig_top20, use_container_width=True)
+        fig_top20 = px.bar(
+            df_top20_melt,
+            x="country_long",
+            y="count",
+            color="medal_type",
+            barmode="group",
+            color_discrete_map=MEDAL_COLOR_MAP,
+        )
+        fig_top20.update_layout(xaxis_tickangle=-45)
+        st.plotly_chart(fig_top20, use_container_width=True)
 
 
 # -----------------------------------------------------
 # TAB 5 — Medals by Gender
 # -----------------------------------------------------
 with tab5:
-    st.subheader("👥 Medal Distribution by Gender")
+    if tab5.open:
+        st.subheader("👥 Medal Distribution by Gender")
 
-    df_gender = (
-        df_filtered.groupby(["gender", "medal_type"])
-        .size().reset_index(name="count")
-    )
-    df_gender = df_gender[df_gender["medal_type"].isin(["Gold", "Silver", "Bronze"])]
-
-    fig_gender = px.bar(
-        df_gender,
-        x="gender",
-        y="count",
-        color="medal_type",
-        barmode="group",
-        color_discrete_map=MEDAL_COLOR_MAP,
-    )
-    st.plotly_chart(fig_gender, use_container_width=True)
+        fig_gender = px.bar(
+            tab_frame("gender_medals"),
+            x="gender",
+            y="count",
+            color="medal_type",
+            barmode="group",
+            color_discrete_map=MEDAL_COLOR_MAP,
+        )
+        st.plotly_chart(fig_gender, use_container_width=True)
 
 
 # -----------------------------------------------------
 # TAB 6 — Top 10 Sports by Medal Count
 # -----------------------------------------------------
 with tab6:
-    st.subheader("🏅 Top 10 Sports by Medal Count")
+    if tab6.open:
+        st.subheader("🏅 Top 10 Sports by Medal Count")
+
+        df_sport_top10 = tab_frame("top_sports")
+        if df_sport_top10 is None:
+            st.info("Sport data unavailable.")
+        else:
+            fig_sport = px.bar(
+                df_sport_top10,
+                x="discipline",
+                y="count",
+                color="medal_type",
+                barmode="group",
+                color_discrete_map=MEDAL_COLOR_MAP,
+            )
+            fig_sport.update_layout(xaxis_tickangle=-45)
+            st.plotly_chart(fig_sport, use_container_width=True)
 
-    if "discipline" not in df_filtered.columns:
-        st.info("Sport data unavailable.")
-    else:
-        df_sport = (
-            df_filtered.groupby(["discipline", "medal_type"])
-            .size().reset_index(name="count")
-        )
 
-        df_sport = df_sport[df_sport["medal_type"].isin(["Gold", "Silver", "Bronze"])]
+# -----------------------------------------------------
+# TAB 7 — Day-by-day Medal Race
+# -----------------------------------------------------
+def medal_race_figure(race, n, scheme):
+    """Animated top-n bar race; frames carry only the values that changed."""
+    frames = race_frames(race, n, scheme)
+    slots = list(range(len(frames[0]["order"])))
+    x_max = race["counts"][:, -1].sum(axis=0).max()
+
+    def frame_layout(frame):
+        layout = {"title": {"text": f"Medal race — {frame['day']:%d %b %Y}"}}
+        if frame["order"] is not None:
+            layout["yaxis"] = {"ticktext": list(race["countries"][frame["order"]])}
+        return layout
+
+    first = frames[0]
+    fig = go.Figure(
+        data=[
+            go.Bar(x=first["x"][t], y=slots, orientation="h", name=medal, marker_color=MEDAL_COLOR_MAP[medal])
+            for t, medal in enumerate(MEDAL_TYPES)
+        ],
+        frames=[
+            go.Frame(
+                name=str(frame["day"]),
+                traces=list(frame["x"]),
+                data=[go.Bar(x=x) for x in frame["x"].values()],
+                layout=frame_layout(frame),
+            )
+            for frame in frames
+        ],
+    )
+    fig.update_layout(
+        frame_layout(first),
+        barmode="stack",
+        height=150 + 28 * len(slots),
+        xaxis={"range": [0, x_max * 1.05], "title": "Medals"},
+        yaxis={"tickvals": slots, "autorange": "reversed"},
+        # Frames are deltas, so playback is sequential (no seek slider)
+        updatemenus=[{
+            "type": "buttons",
+            "direction": "left",
+            "x": 0, "y": 1.12,
+            "buttons": [
+                {"label": "▶ Play", "method": "animate",
+                 "args": [None, {"frame": {"duration": 700, "redraw": True},
+                                 "transition": {"duration": 300}, "fromcurrent": False}]},
+                {"label": "⏸ Pause", "method": "animate",
+                 "args": [[None], {"frame": {"duration": 0, "redraw": False}, "mode": "immediate"}]},
+            ],
+        }],
+    )
+    return fig
 
-        totals = df_sport.groupby("discipline")["count"].sum().reset_index()
-        top10 = totals.sort_values("count", ascending=False).head(10)["discipline"]
 
-        df_sport_top10 = df_sport[df_sport["discipline"].isin(top10)]
+@st.fragment
+def medal_race_section(race):
+    if not race["days"]:
+        st.info("No dated medals for the current filters.")
+        return
 
-        fig_sport = px.bar(
-            df_sport_top10,
-            x="discipline",
-            y="count",
-            color="medal_type",
-            barmode="group",
-            color_discrete_map=MEDAL_COLOR_MAP,
-        )
-        fig_sport.update_layout(xaxis_tickangle=-45)
-        st.plotly_chart(fig_sport, use_container_width=True)
+    c1, c2 = st.columns(2)
+    scheme = c1.radio("Rank by:", ["Total", "Gold"], horizontal=True, key="race_scheme").lower()
+    n = c2.slider("Countries shown:", 5, 30, TOP_N, key="race_top_n")
+    st.plotly_chart(medal_race_figure(race, n, scheme), use_container_width=True)
+
+    day = st.select_slider("Standings after:", options=race["days"], value=race["days"][-1], key="race_day")
+    st.dataframe(
+        standings_table(race, race["days"].index(day), scheme),
+        hide_index=True,
+        use_container_width=True,
+    )
+
+
+with tab7:
+    if tab7.open:
+        st.subheader("📈 Day-by-day Medal Race")
+        medal_race_section(tab_frame("medal_race"))
+
+
+# Compute the other tabs' frames in the background for the next tab switch
+if views is None:
+    tab_cache.prewarm("global_analysis", tab_frames, filters)
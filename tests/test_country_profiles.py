@@ -0,0 +1,24 @@
+import pandas as pd
+import pytest
+
+from utils.country_profiles import _best_results
+from utils.preprocessing import load_results
+
+
+@pytest.fixture(scope="module")
+def best():
+    results = load_results()
+    results["date"] = pd.to_datetime(results["date"], errors="coerce", utc=True)
+    return _best_results(results, n=1000).set_index(
+        ["participant_country_code", "discipline_name", "event_name"]
+    ).sort_index()
+
+
+def test_rank_comes_from_the_final(best):
+    row = best.loc[("USA", "Swimming", "Women's 4 x 100m Freestyle Relay")]
+    assert (row["stage"], row["rank"]) == ("Final", 2)
+
+
+def test_lower_finals_rank_after_final_a(best):
+    row = best.loc[("USA", "Rowing", "Men's Single Sculls")]
+    assert (row["stage"], row["rank"]) == ("Final C", 13)
@@ -0,0 +1,23 @@
+import pytest
+
+from utils.preprocessing import load_results
+from utils.progression import build_progression_index
+
+
+@pytest.fixture(scope="module")
+def rounds():
+    return build_progression_index(load_results())["rounds"]
+
+
+def test_final_is_last_round(rounds):
+    finals = rounds[rounds["phase"] == "FNL"]
+    assert not finals.empty
+    not_last = finals.loc[~finals["is_last_round"], "event_code"].tolist()
+    assert not_last == []
+
+
+def test_bracket_phases_in_order(rounds):
+    bracket = ["8FNL", "QFNL", "SFNL", "FNL"]
+    for event_code, phases in rounds.groupby("event_code")["phase"]:
+        seen = [p for p in phases if p in bracket]
+        assert seen == sorted(seen, key=bracket.index), event_code
@@ -0,0 +1,18 @@
+import os
+
+import pandas as pd
+
+from utils import query
+from utils.preprocessing import DATA_DIR
+
+
+def test_country_totals_match_medals_total():
+    table = query.medals_by("country").set_index("country_code")
+    totals = pd.read_csv(os.path.join(DATA_DIR, "medals_total.csv")).set_index("country_code")
+    for noc in ["USA", "CHN", "FRA"]:
+        assert table.loc[noc, "Total"] == totals.loc[noc, "Total"], noc
+
+
+def test_team_medal_counts_once():
+    table = query.medals_by("discipline", countries=["FRA"]).set_index("discipline")
+    assert table.loc["Basketball", "Silver"] == 2
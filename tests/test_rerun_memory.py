@@ -0,0 +1,53 @@
+import gc
+import os
+import tracemalloc
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from utils.preprocessing import DATA_DIR
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Peak traced allocations (MB) of one warm rerun at default filters, without
+# materialized views: about 1.3x the measured peak. A deep copy in
+# apply_global_filters or st.cache_data in cache_frames (one unpickled copy
+# per rerun) raises Home to 3.3 MB and Sports & Events to 4.1 MB.
+BASELINES_MB = {
+    "_🏠_Home.py": 1.3,
+    "pages/_🗺️_Global_Analysis.py": 1.3,
+    "pages/_🏟️_Sports_and_Events.py": 0.9,
+    "pages/_👤_Athlete_Performance.py": 1.8,
+    "pages/_🔎_Results_Explorer.py": 0.4,
+    "pages/_🌐_Country_Profile.py": 0.75,
+}
+NEEDS_ATHLETES = {"_🏠_Home.py", "pages/_👤_Athlete_Performance.py", "pages/_🌐_Country_Profile.py"}
+
+
+@pytest.fixture(autouse=True)
+def no_views(monkeypatch):
+    # Measure the live aggregation path, not frames read from build/views
+    monkeypatch.setattr("utils.views.check_manifest", lambda: (None, "disabled in tests"))
+
+
+@pytest.mark.parametrize("page", list(BASELINES_MB))
+def test_rerun_peak_memory(page):
+    if page in NEEDS_ATHLETES and not os.path.exists(os.path.join(DATA_DIR, "athletes.csv")):
+        pytest.skip("data/athletes.csv not available")
+
+    at = AppTest.from_file(os.path.join(ROOT, page), default_timeout=180)
+    at.run()  # cold run: loads and caches the datasets
+    at.run()  # first warm rerun still fills per-process caches
+    assert not at.exception
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        at.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert not at.exception
+    peak_mb = peak / 2**20
+    assert peak_mb < BASELINES_MB[page], f"{peak_mb:.2f} MB"
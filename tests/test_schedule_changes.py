@@ -0,0 +1,116 @@
+import pandas as pd
+import pytest
+
+from utils import schedule_changes
+from utils.schedule_changes import (
+    FINAL_PATH,
+    PRELIMINARY_PATH,
+    _in,
+    normalize_final,
+    normalize_preliminary,
+    reconcile,
+)
+
+
+def _schedule(*sessions):
+    """Normalized one-venue schedule from (start, end) "HH:MM" pairs."""
+    start = pd.to_datetime([f"2024-07-27 {s}" for s, _ in sessions], utc=True)
+    end = pd.to_datetime([f"2024-07-27 {e}" for _, e in sessions], utc=True)
+    return pd.DataFrame({
+        "venue_code": "CDM", "discipline_code": "JUD",
+        "venue": "Champ-de-Mars Arena", "discipline": "Judo",
+        "day": start.tz_convert("Europe/Paris").date,
+        "start": start, "end": end, "label": "", "cancelled": False,
+    })
+
+
+def _changes(log):
+    return log.sort_values("start_final")["change"].tolist()
+
+
+def test_units_within_a_session_are_not_added():
+    prelim = _schedule(("08:00", "09:00"))
+    final = _schedule(("08:00", "08:06"), ("08:06", "08:12"), ("08:50", "09:10"))
+    log = reconcile(prelim, final)
+    assert _changes(log) == ["unchanged", "within", "within"]
+
+
+def test_moved_sessions_pair_by_nearest_start():
+    prelim = _schedule(("10:00", "10:30"), ("16:00", "16:30"))
+    final = _schedule(("16:40", "17:10"))
+    log = reconcile(prelim, final).set_index("change")
+    assert log.loc["moved", "shift_minutes"] == 40
+    assert log.loc["cancelled", "start_prelim"].hour == 10
+
+
+def test_parallel_sessions_are_logged():
+    # Two mats at 08:00; both final units go to the first one
+    prelim = _schedule(("08:00", "09:00"), ("08:00", "09:00"))
+    final = _schedule(("08:00", "08:06"), ("08:10", "08:16"))
+    log = reconcile(prelim, final)
+    assert sorted(log["change"]) == ["unchanged", "within", "within"]
+    assert log["start_final"].isna().sum() == 1
+
+
+def test_cancelled_status_in_final_schedule():
+    prelim = _schedule(("10:00", "11:00"))
+    final = _schedule(("10:00", "11:00")).assign(cancelled=True)
+    log = reconcile(prelim, final)
+    assert log["change"].tolist() == ["cancelled"]
+    assert log["start_final"].notna().all()
+
+
+@pytest.fixture(scope="module")
+def schedules():
+    return (
+        normalize_preliminary(pd.read_csv(PRELIMINARY_PATH)),
+        normalize_final(pd.read_csv(FINAL_PATH)),
+    )
+
+
+def test_partitioned_diff_matches_full_diff(schedules):
+    prelim, final = schedules
+    key = ["venue_code", "discipline_code", "start_final", "start_prelim", "change"]
+    full = reconcile(prelim, final).sort_values(key).reset_index(drop=True)
+    partitions = set(zip(prelim["venue_code"], prelim["discipline_code"])) | set(
+        zip(final["venue_code"], final["discipline_code"])
+    )
+    parts = [reconcile(_in(prelim, {p}), _in(final, {p})) for p in partitions]
+    split = pd.concat(parts, ignore_index=True).sort_values(key).reset_index(drop=True)
+    pd.testing.assert_frame_equal(full, split)
+
+
+def test_refreshed_file_rediffs_changed_partition(tmp_path, monkeypatch):
+    prelim_path, final_path = tmp_path / "prelim.csv", tmp_path / "final.csv"
+    pd.read_csv(PRELIMINARY_PATH).to_csv(prelim_path, index=False)
+    raw_final = pd.read_csv(FINAL_PATH)
+    raw_final.to_csv(final_path, index=False)
+
+    monkeypatch.setattr(schedule_changes, "PRELIMINARY_PATH", str(prelim_path))
+    monkeypatch.setattr(schedule_changes, "FINAL_PATH", str(final_path))
+    monkeypatch.setattr(schedule_changes, "_sources", {})
+    monkeypatch.setattr(schedule_changes, "_digests", {})
+    monkeypatch.setattr(schedule_changes, "_log", None)
+    monkeypatch.setattr(schedule_changes, "_runs", [])
+
+    before, _ = schedule_changes.schedule_changes()
+
+    # Cancel one session in the final schedule
+    row = raw_final.index[(raw_final["status"] != "CANCELLED") & raw_final["venue_code"].notna()][0]
+    raw_final.loc[row, "status"] = "CANCELLED"
+    raw_final.to_csv(final_path, index=False)
+
+    after, runs = schedule_changes.schedule_changes()
+    assert len(runs) == 2
+    assert runs.iloc[-1]["files"] == "final.csv"
+    assert runs.iloc[-1]["rediffed"] == 1
+    assert (after["change"] == "cancelled").sum() == (before["change"] == "cancelled").sum() + 1
+
+    key = ["venue_code", "discipline_code", "start_final", "start_prelim", "change"]
+    full = reconcile(
+        normalize_preliminary(pd.read_csv(prelim_path)), normalize_final(pd.read_csv(final_path))
+    )
+    pd.testing.assert_frame_equal(
+        after.sort_values(key).reset_index(drop=True),
+        full.sort_values(key).reset_index(drop=True),
+    )
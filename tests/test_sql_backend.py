@@ -0,0 +1,15 @@
+from utils import sql_backend
+from utils.aggregations import aggregate_top_sports
+from utils.filters import apply_global_filters, filter_options
+from utils.preprocessing import prepare_medals_datasets
+
+
+def test_top_sports_match_pandas():
+    _, medallists, _ = prepare_medals_datasets()
+    filters = filter_options(medallists)
+    expected = aggregate_top_sports(apply_global_filters(medallists, filters), 10)
+    actual = sql_backend.top_sport_medals(filters, 10)
+    assert sorted(actual["discipline"].unique()) == sorted(expected["discipline"].unique())
+    merged = expected.merge(actual, on=["discipline", "medal_type"], suffixes=("_pandas", "_sql"))
+    assert len(merged) == len(expected) == len(actual)
+    assert (merged["count_pandas"] == merged["count_sql"]).all()
@@ -0,0 +1,97 @@
+import pandas as pd
+
+# ---------------------------------------
+# Page aggregations (pandas backend)
+# ---------------------------------------
+# Shared by the pages and by the deploy-time view build (utils/views.py),
+# so both produce exactly the same frames.
+MEDAL_TYPES = ["Gold", "Silver", "Bronze"]
+
+
+def aggregate_continent_medals(df):
+    grp = df.groupby(["continent", "medal_type"]).size().reset_index(name="count")
+    return grp[grp["medal_type"].isin(MEDAL_TYPES)]
+
+
+def aggregate_sunburst(df):
+    if "discipline" not in df.columns:
+        df["discipline"] = "Unknown"
+    return df.groupby(
+        ["continent", "country", "discipline"]
+    ).size().reset_index(name="count")
+
+
+def aggregate_gender_medals(df):
+    df_gender = (
+        df.groupby(["gender", "medal_type"])
+        .size().reset_index(name="count")
+    )
+    return df_gender[df_gender["medal_type"].isin(MEDAL_TYPES)]
+
+
+def aggregate_top_sports(df, n=10):
+    df_sport = (
+        df.groupby(["discipline", "medal_type"])
+        .size().reset_index(name="count")
+    )
+    df_sport = df_sport[df_sport["medal_type"].isin(MEDAL_TYPES)]
+
+    totals = df_sport.groupby("discipline")["count"].sum().reset_index()
+    # Ties broken by name, as in sql_backend.top_sport_medals
+    top = totals.sort_values(["count", "discipline"], ascending=[False, True]).head(n)["discipline"]
+    return df_sport[df_sport["discipline"].isin(top)]
+
+
+def aggregate_sport_country(df_medals, events):
+    # Merge medals with event info to get sport
+    medal_events = df_medals.merge(events[['event', 'sport']], on='event', how='left')
+    return medal_events.groupby(["sport", "country"]).size().reset_index(name="Total Medals")
+
+
+def filter_schedule_by_sport(schedule, events, filters):
+    # Merge schedule with event table to get sport
+    schedule_merged = schedule.merge(events[['event', 'sport']], on='event', how='left')
+
+    # Filter by selected sports (global filter)
+    if filters["sport_col"] and filters["selected_sports"]:
+        return schedule_merged[schedule_merged["sport"].isin(filters["selected_sports"])]
+    return schedule_merged
+
+
+def aggregate_venue_durations(schedule_filtered):
+    start = pd.to_datetime(schedule_filtered["start_date"])
+    end = pd.to_datetime(schedule_filtered["end_date"])
+    duration_days = ((end - start).dt.total_seconds() / (24 * 3600)).rename("duration_days")
+
+    venue_intensity = duration_days.groupby(schedule_filtered["venue"]).sum().reset_index()
+    venue_intensity["duration_days"] = venue_intensity["duration_days"].round(2)
+    return venue_intensity.sort_values("duration_days", ascending=False)
+
+
+def aggregate_medal_pie(df_medals_total, medal_types):
+    medal_sum = df_medals_total[MEDAL_TYPES].sum()
+    df_pie = pd.DataFrame({
+        "Medal": MEDAL_TYPES,
+        "Count": medal_sum.values
+    })
+    return df_pie[df_pie["Medal"].isin(medal_types)]
+
+
+def overview_kpis(athletes_filtered, df_medals_total, df_medals_total_filtered, events, selected_countries):
+    return {
+        "Athletes": int(athletes_filtered["name"].nunique()),
+        "Countries": len(selected_countries) if selected_countries else int(df_medals_total["country_code"].nunique()),
+        "Sports": int(events["sport"].nunique()),
+        "Total Medals": int(df_medals_total_filtered["Total"].sum()),
+        "Events": int(events["event"].nunique()),
+    }
+
+
+def aggregate_athlete_medals(df_medals):
+    return df_medals.groupby("name").size().reset_index(name="total_medals")
+
+
+def aggregate_gender_counts(athletes):
+    counts = athletes["gender"].value_counts().reset_index()
+    counts.columns = ["gender", "count"]
+    return counts
@@ -0,0 +1,56 @@
+import logging
+import os
+from collections import OrderedDict
+
+import pandas as pd
+import requests
+
+from utils.cli import run_query
+
+# ---------------------------------------
+# Optional local API (see utils/server.py)
+# ---------------------------------------
+# When OLYMPICS_API_URL is set (e.g. http://127.0.0.1:8600) pages read
+# aggregates from the shared service; otherwise they compute them in process.
+# If the service cannot be reached, the query also runs in process.
+API_URL_ENV = "OLYMPICS_API_URL"
+
+logger = logging.getLogger(__name__)
+
+# url → (etag, frame) of the last 200 response, revalidated with If-None-Match;
+# least recently used urls are dropped beyond ETAG_CACHE_SIZE
+ETAG_CACHE_SIZE = 128
+_etag_cache = OrderedDict()
+
+
+def fetch_frame(query_name, **params):
+    """Result of a named query, from the local API if configured."""
+    base = os.environ.get(API_URL_ENV)
+    if not base:
+        return run_query(query_name, **params)
+
+    params = {k: v for k, v in params.items() if v is not None}
+    req = requests.Request("GET", f"{base.rstrip('/')}/{query_name}", params=params).prepare()
+
+    headers = {}
+    cached = _etag_cache.get(req.url)
+    if cached:
+        headers["If-None-Match"] = cached[0]
+
+    try:
+        resp = requests.get(req.url, headers=headers, timeout=10)
+    except (requests.ConnectionError, requests.Timeout) as e:
+        logger.warning("API at %s unreachable (%s); running %s locally", base, e, query_name)
+        return run_query(query_name, **params)
+    if resp.status_code == 304 and cached:
+        _etag_cache.move_to_end(req.url)
+        return cached[1]
+    resp.raise_for_status()
+
+    df = pd.DataFrame(resp.json())
+    if "ETag" in resp.headers:
+        _etag_cache[req.url] = (resp.headers["ETag"], df)
+        _etag_cache.move_to_end(req.url)
+        while len(_etag_cache) > ETAG_CACHE_SIZE:
+            _etag_cache.popitem(last=False)
+    return df
@@ -0,0 +1,164 @@
+"""Command-line access to the dashboard queries.
+
+Examples:
+    python -m utils.cli medals --by country --top 10
+    python -m utils.cli medals --by discipline --country FRA --out fra.csv
+    python -m utils.cli athlete "LEON MARCHAND"
+    python -m utils.cli schedule 2024-08-01 2024-08-02 --discipline Swimming
+    python -m utils.cli venues --out venues.parquet
+    python -m utils.cli rounds SWMM100MBA
+    python -m utils.cli batch exports.json
+"""
+import argparse
+import json
+import os
+import sys
+
+from utils import query
+from utils.leaderboard import RANKING_SCHEMES
+
+
+# ---------------------------------------
+# Output
+# ---------------------------------------
+def write_frame(df, out=None):
+    """Print a frame, or export it as CSV / Parquet based on the extension."""
+    if out is None:
+        print(df.to_string(index=False))
+        return
+    if out.endswith(".parquet"):
+        df.to_parquet(out, index=False)
+    elif out.endswith(".csv"):
+        df.to_csv(out, index=False)
+    else:
+        raise ValueError(f"Unsupported output format: {out} (use .csv or .parquet)")
+
+
+# ---------------------------------------
+# Query dispatch
+# ---------------------------------------
+def _as_list(value):
+    return [value] if isinstance(value, str) else value
+
+
+def run_query(query_name, **params):
+    """Run one named query with CLI/batch parameters."""
+    top = params.pop("top", None)
+
+    if query_name == "medals":
+        df = query.medals_by(
+            params.get("by", "country"),
+            scheme=params.get("scheme", "total"),
+            countries=_as_list(params.get("country")),
+            continents=_as_list(params.get("continent")),
+            disciplines=_as_list(params.get("discipline")),
+            medal_types=_as_list(params.get("medal_type")),
+            genders=_as_list(params.get("gender")),
+        )
+    elif query_name == "athlete":
+        df = query.athlete_profile(params["name"])
+    elif query_name == "schedule":
+        df = query.schedule_window(
+            params["start"], params["end"],
+            discipline=params.get("discipline"),
+            venue=params.get("venue"),
+        )
+    elif query_name == "venues":
+        df = query.venue_load(
+            params.get("start"), params.get("end"),
+            discipline=params.get("discipline"),
+        )
+    elif query_name == "rounds":
+        df = query.event_progression(params["event_code"])
+    elif query_name == "path":
+        df = query.participant_progression(
+            params["participant_code"], params.get("event_code")
+        )
+    else:
+        raise ValueError(f"Unknown query: {query_name}")
+
+    return df.head(top) if top else df
+
+
+def run_batch(spec_path, out_dir=None):
+    """Run every query of a JSON spec: [{"query": ..., "out": ..., ...}, ...]."""
+    with open(spec_path) as f:
+        jobs = json.load(f)
+
+    for job in jobs:
+        params = dict(job)
+        name = params.pop("query")
+        out = params.pop("out")
+        if out_dir:
+            out = os.path.join(out_dir, out)
+        write_frame(run_query(name, **params), out)
+        print(f"{name} → {out}")
+
+
+# ---------------------------------------
+# Argument parsing
+# ---------------------------------------
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m utils.cli", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="query", required=True)
+
+    medals = sub.add_parser("medals", help="Medal table by dimension")
+    medals.add_argument("--by", choices=query.MEDAL_DIMENSIONS, default="country")
+    medals.add_argument("--scheme", choices=list(RANKING_SCHEMES), default="total",
+                        help="Ranking scheme when --by country")
+    medals.add_argument("--country", nargs="+", help="NOC codes")
+    medals.add_argument("--continent", nargs="+")
+    medals.add_argument("--discipline", nargs="+")
+    medals.add_argument("--medal-type", nargs="+", choices=["Gold", "Silver", "Bronze"])
+    medals.add_argument("--gender", nargs="+")
+
+    athlete = sub.add_parser("athlete", help="Athlete profile and medal count")
+    athlete.add_argument("name")
+
+    schedule = sub.add_parser("schedule", help="Sessions within a time window")
+    schedule.add_argument("start")
+    schedule.add_argument("end")
+    schedule.add_argument("--discipline")
+    schedule.add_argument("--venue")
+
+    venues = sub.add_parser("venues", help="Total session duration per venue")
+    venues.add_argument("--start")
+    venues.add_argument("--end")
+    venues.add_argument("--discipline")
+
+    rounds = sub.add_parser("rounds", help="Ordered rounds of an event")
+    rounds.add_argument("event_code")
+
+    path = sub.add_parser("path", help="Round-by-round path of a participant")
+    path.add_argument("participant_code")
+    path.add_argument("--event-code")
+
+    for p in (medals, athlete, schedule, venues, rounds, path):
+        p.add_argument("--top", type=int, help="Keep only the first N rows")
+        p.add_argument("--out", help="Export to .csv or .parquet instead of printing")
+
+    batch = sub.add_parser("batch", help="Run a JSON list of queries and export each")
+    batch.add_argument("spec")
+    batch.add_argument("--out-dir")
+
+    return parser
+
+
+def main(argv=None):
+    args = vars(build_parser().parse_args(argv))
+    name = args.pop("query")
+
+    try:
+        if name == "batch":
+            run_batch(args["spec"], args["out_dir"])
+        else:
+            out = args.pop("out")
+            write_frame(run_query(name, **args), out)
+    except (KeyError, ValueError, FileNotFoundError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import numpy as np
+import pandas as pd
+
+from utils.progression import build_progression_index
+
+# ---------------------------------------
+# Per-NOC country profile store
+# ---------------------------------------
+# Every dataset is aggregated and split by country code once at load time;
+# opening a country is then a dict lookup returning small, ready-to-render
+# frames instead of filtering each full table again.
+MEDAL_TYPES = ["Gold", "Silver", "Bronze"]
+BEST_RESULTS = 15
+SESSION_STATUSES = ["Finished", "Live", "Upcoming", "Cancelled"]
+SCHEDULE_TZ = "Europe/Paris"
+
+# stage_code = event code (22) + phase (4) + unit number; schedules.csv urls
+# end with the lowercased phase + unit part, padded with "-" to 12 chars
+PHASE_SLICE = slice(22, 26)
+UNIT_SLICE = slice(22, None)
+UNIT_LENGTH = 12
+
+
+def _split(df, key="country_code"):
+    """{noc: rows without the key column}, in one groupby pass."""
+    return {
+        noc: grp.drop(columns=key).reset_index(drop=True)
+        for noc, grp in df.groupby(key, sort=False)
+    }
+
+
+def _medal_counts(df, index):
+    counts = (
+        df[df["medal_type"].isin(MEDAL_TYPES)]
+        .groupby(index + ["medal_type"]).size()
+        .unstack("medal_type", fill_value=0)
+        .reindex(columns=MEDAL_TYPES, fill_value=0)
+    )
+    counts["Total"] = counts.sum(axis=1)
+    counts.columns.name = None
+    return counts.reset_index().sort_values(
+        ["country_code", "Total"] + MEDAL_TYPES, ascending=[True, False, False, False, False]
+    )
+
+
+def _sessions(results, schedules):
+    """Scheduled sessions each NOC takes part in, one row per (NOC, session).
+
+    schedules.csv has no NOC column: a session is linked to the result units
+    it lists (last segment of its url, e.g. "gpc-000100--"), or to a whole
+    phase when the schedule lists the phase as one session ("qual--------").
+    Units missing from the schedule keep their result date and venue.
+    """
+    units = (
+        results.groupby(["participant_country_code", "stage_code"])
+        .agg(
+            discipline_code=("discipline_code", "first"),
+            event_name=("event_name", "first"),
+            discipline=("discipline_name", "first"),
+            stage=("stage", "first"),
+            venue=("venue", "first"),
+            date=("date", "min"),
+            entries=("participant_code", "nunique"),
+        )
+        .reset_index()
+    )
+    units["unit"] = units["stage_code"].str[UNIT_SLICE].str.lower()
+    units["phase_unit"] = units["stage_code"].str[PHASE_SLICE].str.lower().str.ljust(UNIT_LENGTH, "-")
+
+    sched = pd.DataFrame({
+        "session": schedules.index,
+        "discipline_code": schedules["discipline_code"],
+        "event_name": schedules["event"],
+        "unit": schedules["url"].str.split("/").str[-1],
+        "start": pd.to_datetime(schedules["start_date"], utc=True).dt.tz_convert(SCHEDULE_TZ),
+        "end": pd.to_datetime(schedules["end_date"], utc=True).dt.tz_convert(SCHEDULE_TZ),
+        "phase": schedules["phase"],
+        "schedule_venue": schedules["venue"],
+        "schedule_status": schedules["status"],
+    })
+    keys = ["discipline_code", "event_name"]
+    by_unit = units.merge(sched, on=keys + ["unit"])
+    rest = units[~units["stage_code"].isin(by_unit["stage_code"])]
+    by_phase = rest.merge(sched.rename(columns={"unit": "phase_unit"}), on=keys + ["phase_unit"])
+    unmatched = rest[~rest["stage_code"].isin(by_phase["stage_code"])]
+
+    scheduled = (
+        pd.concat([by_unit, by_phase])
+        .groupby(["participant_country_code", "session"])
+        .agg(
+            start=("start", "first"),
+            end=("end", "first"),
+            discipline=("discipline", "first"),
+            event=("event_name", "first"),
+            phase=("phase", "first"),
+            venue=("schedule_venue", "first"),
+            entries=("entries", "sum"),
+            schedule_status=("schedule_status", "first"),
+        )
+        .reset_index()
+        .drop(columns="session")
+    )
+    start = unmatched["date"].dt.tz_convert(SCHEDULE_TZ)
+    unscheduled = pd.DataFrame({
+        "participant_country_code": unmatched["participant_country_code"],
+        "start": start,
+        "end": pd.Series(pd.NaT, index=start.index, dtype=start.dtype),
+        "discipline": unmatched["discipline"],
+        "event": unmatched["event_name"],
+        "phase": unmatched["stage"],
+        "venue": unmatched["venue"],
+        "entries": unmatched["entries"],
+        "schedule_status": "",
+    })
+    return pd.concat([scheduled, unscheduled], ignore_index=True).sort_values(
+        ["participant_country_code", "start"]
+    )
+
+
+def session_status(sessions, now=None):
+    """Sessions with a `status` column evaluated at `now` (render time).
+
+    Cancelled and finished sessions follow schedules.csv; the others are
+    Finished, Live or Upcoming depending on the current time.
+    """
+    now = now or pd.Timestamp.now(tz="UTC")
+    if sessions.empty:
+        return sessions.assign(status=pd.Series(dtype=str))
+    schedule_status = sessions["schedule_status"]
+    end = sessions["end"].fillna(sessions["start"])
+    status = np.select(
+        [
+            schedule_status.eq("CANCELLED"),
+            schedule_status.eq("FINISHED") | (end <= now),
+            sessions["start"] <= now,
+        ],
+        ["Cancelled", "Finished", "Live"],
+        default="Upcoming",
+    )
+    return sessions.drop(columns="schedule_status").assign(status=status)
+
+
+def _final_places(paths):
+    """Rank of last-round rows as an overall place in the event.
+
+    A last round can hold several ranked stages ("Final A" ... "Final F",
+    "Final" / "Small Final"); their ranks restart at 1, so each stage is
+    offset by the entrants of the stages before it (in name order).
+    """
+    last = paths[paths["is_last_round"]]
+    sizes = last.groupby(["event_code", "stage"])["participant_code"].nunique()
+    offsets = sizes.groupby(level="event_code").cumsum() - sizes
+    offset = pd.MultiIndex.from_frame(last[["event_code", "stage"]]).map(offsets.to_dict())
+    return paths["rank"].add(pd.Series(offset, index=last.index), fill_value=0)
+
+
+def _best_results(results, n=BEST_RESULTS):
+    """Place in the furthest round of each event, finals first, top n per NOC.
+
+    The furthest round comes from the progression index, so a heat win does
+    not hide the place in the final; in the event's last round `rank` is the
+    overall place. NOCs that did not reach it keep their rank in the
+    furthest round they played.
+    """
+    index = build_progression_index(results)
+    paths = index["paths"].merge(
+        index["rounds"][["event_code", "round_order", "is_last_round"]],
+        on=["event_code", "round_order"],
+    )
+    furthest = paths.groupby(["participant_country_code", "event_code"])["round_order"].transform("max")
+    paths = paths[paths["round_order"] == furthest].dropna(subset=["rank"])
+    paths = paths.assign(rank=_final_places(paths))
+    best = (
+        paths.sort_values(["participant_country_code", "is_last_round", "rank", "date"], ascending=[True, False, True, True])
+        .drop_duplicates(["participant_country_code", "event_code"])
+        .groupby("participant_country_code").head(n)
+    )
+    return best[[
+        "participant_country_code", "discipline_name", "event_name", "stage",
+        "participant_name", "rank", "result", "date",
+    ]]
+
+
+def build_country_profiles(medals_total, medals, medallists, athletes, teams, coaches, results, schedules):
+    """Profile of every NOC, keyed by country code.
+
+    Each profile holds a "summary" dict and frames: "medals_by_discipline",
+    "medallists", "sessions", "best_results", "teams" and "coaches".
+    Sessions carry the schedule status; pass them through `session_status`
+    when rendering, so Finished/Upcoming follows the current time.
+    """
+    results = results.copy(deep=False)
+    results["date"] = pd.to_datetime(results["date"], errors="coerce", utc=True)
+    results["result"] = results["result"].where(results["result"].isna(), results["result"].astype(str))
+
+    totals = medals_total.rename(columns={f"{m} Medal": m for m in MEDAL_TYPES}).set_index("country_code")
+    # Standing by total medals, ties sharing the better rank
+    standing = totals["Total"].rank(method="min", ascending=False).astype(int)
+
+    parts = {
+        "medals_by_discipline": _split(_medal_counts(medals, ["country_code", "discipline"])),
+        "medallists": _split(_medal_counts(medallists, ["country_code", "name", "discipline"])),
+        "sessions": _split(_sessions(results, schedules), "participant_country_code"),
+        "best_results": _split(_best_results(results), "participant_country_code"),
+        "teams": _split(teams[["country_code", "team", "discipline", "events", "num_athletes"]]),
+        "coaches": _split(coaches[["country_code", "name", "function", "disciplines", "events"]]),
+    }
+    n_athletes = athletes.groupby("country_code")["name"].nunique()
+    n_disciplines = results.groupby("participant_country_code")["discipline_name"].nunique()
+
+    names = pd.concat([
+        df.drop_duplicates("country_code").set_index("country_code")["country"]
+        for df in (medals_total, athletes, teams, coaches)
+    ])
+    names = names[~names.index.duplicated()]
+
+    nocs = set(totals.index).union(n_athletes.index, n_disciplines.index, *(p.keys() for p in parts.values()))
+    profiles = {}
+    for noc in sorted(n for n in nocs if isinstance(n, str)):
+        medals_row = totals.loc[noc] if noc in totals.index else {}
+        counts = {m: int(medals_row.get(m, 0)) for m in MEDAL_TYPES}
+        profile = {
+            "summary": {
+                "country": names.get(noc, noc),
+                **counts,
+                "Total": sum(counts.values()),
+                "standing": int(standing[noc]) if noc in standing.index else None,
+                "athletes": int(n_athletes.get(noc, 0)),
+                "teams": len(parts["teams"].get(noc, ())),
+                "coaches": len(parts["coaches"].get(noc, ())),
+                "disciplines": int(n_disciplines.get(noc, 0)),
+            },
+        }
+        for name, split in parts.items():
+            profile[name] = split.get(noc, pd.DataFrame())
+        profiles[noc] = profile
+    return profiles
@@ -11,62 +11,47 @@ def global_filters(df_base: pd.DataFrame):
     - Gender (if exists)
     """
 
+    options = filter_options(df_base)
+
     with st.sidebar:
         st.header("🌍 Global Filters")
 
         # -------- 1. Continent Filter --------
-        if "continent" in df_base.columns:
-            continents = sorted(df_base["continent"].dropna().unique())
+        if options["continent"] is not None:
             selected_continents = st.multiselect(
-                "Continent:", continents, default=continents
+                "Continent:", options["continent"], default=options["continent"]
             )
         else:
             selected_continents = None
 
         # -------- 2. Country Filter --------
-        if "country_code" in df_base.columns:
-            country_col = "country_code"
-        elif "country" in df_base.columns:
-            country_col = "country"
-        else:
-            country_col = df_base.columns[0]  # fallback
-
-        countries = sorted(df_base[country_col].dropna().unique())
+        country_col = options["country_col"]
         selected_countries = st.multiselect(
             "Country (NOC):",
-            options=countries,
-            default=countries
+            options=options["selected_countries"],
+            default=options["selected_countries"]
         )
 
         # -------- 3. Sport / Discipline Filter --------
-        if "discipline" in df_base.columns:
-            sport_col = "discipline"
-        elif "sport" in df_base.columns:
-            sport_col = "sport"
-        else:
-            sport_col = None
-
+        sport_col = options["sport_col"]
         if sport_col:
-            sports = sorted(df_base[sport_col].dropna().unique())
             selected_sports = st.multiselect(
-                "Sport / Discipline:", sports, default=sports
+                "Sport / Discipline:", options["selected_sports"], default=options["selected_sports"]
             )
         else:
             selected_sports = None
 
         # -------- 4. Medal Types --------
-        medal_types = ["Gold", "Silver", "Bronze"]
         selected_medal_types = [
-            m for m in medal_types if st.checkbox(m, value=True, key=f"medal_{m}")
+            m for m in options["selected_medal_types"] if st.checkbox(m, value=True, key=f"medal_{m}")
         ]
 
         # -------- 5. Gender Filter --------
-        if "gender" in df_base.columns:
-            genders = sorted(df_base["gender"].dropna().unique())
+        if options["selected_genders"] is not None:
             selected_genders = st.multiselect(
                 "Gender:",
-                options=genders,
-                default=genders
+                options=options["selected_genders"],
+                default=options["selected_genders"]
             )
         else:
             selected_genders = None
@@ -82,8 +67,54 @@ def global_filters(df_base: pd.DataFrame):
     }
 
 
+def filter_options(df_base: pd.DataFrame) -> dict:
+    """
+    All options of the global filters, in the same shape as the dict
+    returned by `global_filters` (which selects everything by default).
+    """
+    if "country_code" in df_base.columns:
+        country_col = "country_code"
+    elif "country" in df_base.columns:
+        country_col = "country"
+    else:
+        country_col = df_base.columns[0]  # fallback
+
+    if "discipline" in df_base.columns:
+        sport_col = "discipline"
+    elif "sport" in df_base.columns:
+        sport_col = "sport"
+    else:
+        sport_col = None
+
+    def options(col):
+        return sorted(df_base[col].dropna().unique())
+
+    return {
+        "continent": options("continent") if "continent" in df_base.columns else None,
+        "country_col": country_col,
+        "selected_countries": options(country_col),
+        "sport_col": sport_col,
+        "selected_sports": options(sport_col) if sport_col else None,
+        "selected_medal_types": ["Gold", "Silver", "Bronze"],
+        "selected_genders": options("gender") if "gender" in df_base.columns else None,
+    }
+
+
+def filters_are_default(filters: dict, df_base: pd.DataFrame) -> bool:
+    """True when every global filter still selects all of its options."""
+    for key, default in filter_options(df_base).items():
+        selected = filters[key]
+        if isinstance(default, list):
+            if selected is None or sorted(selected) != sorted(default):
+                return False
+        elif selected != default:
+            return False
+    return True
+
+
 def apply_global_filters(df: pd.DataFrame, filters: dict) -> pd.DataFrame:
-    df_f = df.copy()
+    # Shallow: each filter step below returns a new frame, never a deep copy
+    df_f = df.copy(deep=False)
 
     # Continent
     if "continent" in df_f.columns and filters["continent"]:
@@ -0,0 +1,108 @@
+import pandas as pd
+import streamlit as st
+
+# ---------------------------------------
+# Depth-limited drill-down for sunburst / treemap charts
+# ---------------------------------------
+# A hierarchy is aggregated once per filter state; each render then sends
+# only a few levels below the current drill path, capped at a node budget
+# (the smallest siblings are lumped into an "Other" node).
+MAX_NODES = 120
+DRILL_DEPTH = 2
+ALL = "(all)"
+
+
+def build_hierarchy(df, levels, value="count"):
+    """Children of every internal node, keyed by path tuple (root = ()).
+
+    Each entry is a frame [name, value] sorted by value, largest first.
+    """
+    children = {}
+    for depth in range(len(levels)):
+        keys = levels[:depth + 1]
+        grp = df.groupby(keys)[value].sum().reset_index()
+        grp = grp.sort_values([value] + keys, ascending=[False] + [True] * len(keys))
+        grp = grp.rename(columns={keys[-1]: "name"})
+
+        if depth == 0:
+            children[()] = grp[["name", value]].reset_index(drop=True)
+            continue
+        for parent, sub in grp.groupby(keys[:-1], sort=False):
+            parent = parent if isinstance(parent, tuple) else (parent,)
+            children[parent] = sub[["name", value]].reset_index(drop=True)
+
+    return {"levels": list(levels), "value": value, "children": children}
+
+
+def drill_nodes(hierarchy, path=(), depth=DRILL_DEPTH, max_nodes=MAX_NODES, root_label="All"):
+    """Nodes [id, label, parent, value, group] under `path`, `depth` levels deep.
+
+    Plot with ids/names/parents and branchvalues="total". At most
+    `max_nodes` nodes are returned, root and "Other" nodes included.
+    """
+    value = hierarchy["value"]
+    children = hierarchy["children"]
+    path = tuple(path)
+
+    root_id = "/".join((root_label,) + path)
+    root_total = children[path][value].sum() if path in children else 0
+    group = {root_id: path[0] if path else root_label}
+    nodes = [(root_id, path[-1] if path else root_label, "", root_total, group[root_id])]
+
+    frontier = [(path, root_id)]
+    budget = max_nodes - 1
+    for _ in range(depth):
+        candidates = []
+        for node_path, node_id in frontier:
+            if node_path in children:
+                ch = children[node_path]
+                candidates += zip(ch[value], ch["name"], [node_path] * len(ch), [node_id] * len(ch))
+        if not candidates or budget <= 0:
+            break
+        candidates.sort(key=lambda c: -c[0])
+
+        # Keep the largest nodes; every parent with dropped children needs one "Other"
+        kept, rest = candidates[:budget], candidates[budget:]
+        while kept and len(kept) + len({c[3] for c in rest}) > budget:
+            rest.insert(0, kept.pop())
+
+        frontier = []
+        for v, name, node_path, parent_id in kept:
+            node_id = f"{parent_id}/{name}"
+            group[node_id] = group[parent_id] if node_path else name
+            nodes.append((node_id, name, parent_id, v, group[node_id]))
+            frontier.append((node_path + (name,), node_id))
+
+        other = {}
+        for v, _, _, parent_id in rest:
+            total, n = other.get(parent_id, (0, 0))
+            other[parent_id] = (total + v, n + 1)
+        for parent_id, (total, n) in other.items():
+            nodes.append((f"{parent_id}/…", f"Other ({n})", parent_id, total, group[parent_id]))
+
+        budget -= len(kept) + len(other)
+
+    return pd.DataFrame(nodes, columns=["id", "label", "parent", "value", "group"])
+
+
+def drill_path_controls(hierarchy, key):
+    """Breadcrumb selectboxes (one per level) returning the drill path."""
+    levels = hierarchy["levels"]
+    children = hierarchy["children"]
+
+    path = ()
+    cols = st.columns(len(levels) - 1)
+    for depth, col in enumerate(cols):
+        options = [
+            name for name in children.get(path, pd.DataFrame(columns=["name"]))["name"]
+            if path + (name,) in children
+        ]
+        if not options:
+            break
+        choice = col.selectbox(
+            f"Drill into {levels[depth]}:", [ALL] + sorted(options), key=f"{key}_{depth}"
+        )
+        if choice == ALL:
+            break
+        path += (choice,)
+    return path
@@ -0,0 +1,98 @@
+import pandas as pd
+
+# ---------------------------------------
+# Ranking schemes
+# ---------------------------------------
+MEDAL_COLUMNS = ["Gold", "Silver", "Bronze"]
+
+POINT_WEIGHTS = {"Gold": 3, "Silver": 2, "Bronze": 1}
+
+# Scheme → columns compared (descending) to decide the rank.
+# Rows with equal values on every column share the same rank.
+RANKING_SCHEMES = {
+    "total": ["Total"],
+    "gold_first": ["Gold", "Silver", "Bronze"],
+    "points": ["Points"],
+    "gold": ["Gold"],
+    "silver": ["Silver"],
+    "bronze": ["Bronze"],
+}
+
+CUBE_DIMS = ["country_code", "country", "country_long", "continent", "discipline", "gender"]
+COUNTRY_KEYS = ["country_code", "country", "country_long", "continent"]
+
+
+# ---------------------------------------
+# Pre-aggregated medal counts
+# ---------------------------------------
+def medal_count_cube(df, dims=CUBE_DIMS):
+    """Collapse medal rows into counts per (dims, medal_type).
+
+    The cube keeps the columns used by `apply_global_filters`, so it can be
+    filtered with the same filter dict as the raw rows.
+    """
+    dims = [d for d in dims if d in df.columns]
+    return (
+        df.groupby(dims + ["medal_type"], dropna=False)
+        .size()
+        .reset_index(name="count")
+    )
+
+
+def counts_from_cube(cube, keys=COUNTRY_KEYS):
+    """Sum a (filtered) cube into one Gold/Silver/Bronze row per NOC."""
+    keys = [k for k in keys if k in cube.columns]
+    counts = cube.pivot_table(
+        index=keys,
+        columns="medal_type",
+        values="count",
+        aggfunc="sum",
+        fill_value=0,
+    ).reset_index()
+    counts.columns.name = None
+    return counts
+
+
+# ---------------------------------------
+# Leaderboard
+# ---------------------------------------
+def build_leaderboard(counts, schemes=RANKING_SCHEMES):
+    """Rank every NOC under each scheme.
+
+    Returns {scheme: DataFrame} where each frame is sorted by rank and carries
+    a tie-aware `rank` column (and `continent_rank` when a continent column
+    is present), so a "Top N" is just a slice of the frame.
+    """
+    board = counts.copy()
+    for m in MEDAL_COLUMNS:
+        if m not in board.columns:
+            board[m] = 0
+    board["Total"] = board[MEDAL_COLUMNS].sum(axis=1)
+    board["Points"] = sum(board[m] * w for m, w in POINT_WEIGHTS.items())
+
+    leaderboard = {}
+    for scheme, keys in schemes.items():
+        # ngroup() numbers the distinct key tuples in lexicographic order,
+        # giving one comparable score even for multi-column schemes.
+        score = board.groupby(keys, sort=True).ngroup()
+        ranked = board.assign(rank=score.rank(method="min", ascending=False).astype(int))
+        if "continent" in board.columns:
+            ranked["continent_rank"] = (
+                score.groupby(board["continent"])
+                .rank(method="min", ascending=False)
+                .astype(int)
+            )
+        leaderboard[scheme] = ranked.sort_values(
+            ["rank", "country_code"]
+        ).reset_index(drop=True)
+    return leaderboard
+
+
+def top_n(leaderboard, scheme="total", n=10, continent=None, countries=None):
+    """Slice the first `n` rows of a precomputed ranking."""
+    board = leaderboard[scheme]
+    if continent is not None:
+        board = board[board["continent"] == continent]
+    if countries:
+        board = board[board["country_code"].isin(countries)]
+    return board.head(n)
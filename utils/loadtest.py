@@ -0,0 +1,340 @@
+"""Concurrent-session load test for the dashboard.
+
+    python -m utils.loadtest --sessions 20 --duration 60
+    python -m utils.loadtest --url http://127.0.0.1:8501 --pid 1234 --scenario scenario.json
+
+Starts the app with `streamlit run` (unless --url is given) and drives N
+simulated browser sessions over Streamlit's websocket protocol. Every step
+of the scenario is one script rerun; its latency is the time from sending
+the rerun request to receiving `script_finished`. Reports throughput,
+p50/p95/p99 latency per step and server RSS over time.
+
+A scenario is a JSON list of steps, run in a loop by every session:
+    {"page": "Global_Analysis"}                 switch page (url path name)
+    {"select": "Select a sport:", "value": "Swimming"}   selectbox / radio
+    {"slider": "How many athletes?", "value": 15}
+        add "nth": 1 to pick the second widget of that type with that label
+    {"rerun": true}                             plain rerun of the current page
+    {"think": 0.5}                              pause (seconds), not measured
+"""
+import argparse
+import asyncio
+import csv
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+from websockets.asyncio.client import connect as websocket_connect
+from websockets.exceptions import ConnectionClosed
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SCENARIO = [
+    {"page": ""},
+    {"think": 0.5},
+    {"page": "Global_Analysis"},
+    {"think": 0.5},
+    {"page": "Sports_and_Events"},
+    {"select": "Select a sport:", "value": "Athletics"},
+    {"think": 0.5},
+    {"page": "Athlete_Performance"},
+    {"slider": "How many athletes?", "value": 15},
+    {"think": 0.5},
+    {"page": "Road_to_the_Final"},
+    {"think": 0.5},
+]
+
+
+# ---------------------------------------
+# Server process
+# ---------------------------------------
+def start_server(port):
+    main_script = glob.glob(os.path.join(ROOT, "_*_Home.py"))[0]
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", main_script,
+         "--server.headless", "true", "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(120):
+        try:
+            with urllib.request.urlopen(f"{url}/_stcore/health", timeout=1):
+                return proc, url
+        except OSError:
+            time.sleep(0.5)
+    proc.terminate()
+    raise RuntimeError("Streamlit server did not become healthy")
+
+
+def process_rss_mb(pid):
+    """RSS of a process and its children (Linux /proc)."""
+    total_kb = 0
+    pids = [pid]
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            pids += [int(p) for p in f.read().split()]
+    except OSError:
+        pass
+    for p in pids:
+        try:
+            with open(f"/proc/{p}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+        except OSError:
+            pass
+    return total_kb / 1024
+
+
+class RssSampler(threading.Thread):
+    def __init__(self, pid, interval):
+        super().__init__(daemon=True)
+        self.pid, self.interval = pid, interval
+        self.samples = []
+        self.stopped = threading.Event()
+
+    def run(self):
+        start = time.monotonic()
+        while not self.stopped.is_set():
+            self.samples.append((time.monotonic() - start, process_rss_mb(self.pid)))
+            self.stopped.wait(self.interval)
+
+
+# ---------------------------------------
+# Simulated session
+# ---------------------------------------
+class Session:
+    def __init__(self, url):
+        self.ws_url = url.replace("http", "ws", 1) + "/_stcore/stream"
+        self.ws = None
+        self.pages = {}          # url path name → page_script_hash
+        self.page_hash = ""
+        self.widgets = {}        # widget id → (type, widget proto, fragment id) on the current page
+        self.widget_states = {}  # id → WidgetState
+
+    async def connect(self):
+        self.ws = await websocket_connect(self.ws_url, subprotocols=["streamlit"], max_size=None)
+
+    async def rerun(self, fragment_id=""):
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.page_script_hash = self.page_hash
+        state.fragment_id = fragment_id
+        state.widget_states.widgets.extend(self.widget_states.values())
+        await self.ws.send(msg.SerializeToString())
+
+        widgets = {}
+        while True:
+            try:
+                raw = await self.ws.recv()
+            except ConnectionClosed:
+                raise ConnectionError("websocket closed") from None
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+            if kind in ("new_session", "navigation"):
+                pages = getattr(fwd, kind).app_pages
+                self.pages.update({p.url_pathname: p.page_script_hash for p in pages})
+            elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                etype = element.WhichOneof("type")
+                if etype in ("selectbox", "radio", "slider"):
+                    widget = getattr(element, etype)
+                    widgets[widget.id] = (etype, widget, fwd.delta.fragment_id)
+            elif kind == "script_finished":
+                if fwd.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    raise RuntimeError("script compile error")
+                if fwd.script_finished == ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY:
+                    self.widgets.update(widgets)
+                    return
+                if fwd.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    self.widgets = widgets
+                    return
+
+    def set_widget(self, label, value, kinds, nth=0):
+        """Set the nth widget of `kinds` with this label (page order).
+
+        Returns its fragment id ("" outside fragments).
+        """
+        matches = [w for w in self.widgets.values() if w[1].label == label and w[0] in kinds]
+        if len(matches) <= nth:
+            raise KeyError(f"{'/'.join(kinds)} not on page: {label}" + (f" (nth={nth})" if nth else ""))
+        etype, widget, fragment_id = matches[nth]
+        state = WidgetState(id=widget.id)
+        if etype == "slider":
+            state.double_array_value.data.append(float(value))
+        else:
+            state.string_value = str(value)
+        self.widget_states[widget.id] = state
+        return fragment_id
+
+    async def step(self, step):
+        """Apply one scenario step; returns the step name if it was a rerun.
+
+        Widgets inside an st.fragment trigger a fragment rerun, as in a browser.
+        """
+        fragment_id = ""
+        if "think" in step:
+            await asyncio.sleep(step["think"])
+            return None
+        if "page" in step:
+            if step["page"] not in self.pages:
+                raise KeyError(f"unknown page: {step['page']}")
+            self.page_hash = self.pages[step["page"]]
+            self.widget_states = {}
+            name = f"page:{step['page'] or 'Home'}"
+        elif "select" in step:
+            fragment_id = self.set_widget(step["select"], step["value"], ("selectbox", "radio"), step.get("nth", 0))
+            name = f"select:{step['select']}"
+        elif "slider" in step:
+            fragment_id = self.set_widget(step["slider"], step["value"], ("slider",), step.get("nth", 0))
+            name = f"slider:{step['slider']}"
+        else:
+            name = "rerun"
+        await self.rerun(fragment_id)
+        return name
+
+
+async def run_session(url, scenario, deadline, records, errors, delay):
+    await asyncio.sleep(delay)
+    session = Session(url)
+    try:
+        await session.connect()
+        await session.rerun()
+    except Exception as e:
+        errors.append(f"connect: {e}")
+        return
+
+    while time.monotonic() < deadline:
+        for step in scenario:
+            if time.monotonic() >= deadline:
+                break
+            start = time.monotonic()
+            try:
+                name = await session.step(step)
+            except KeyError as e:
+                errors.append(str(e.args[0]))
+                continue
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+                return
+            if name:
+                records.append((time.monotonic(), name, time.monotonic() - start))
+    await session.ws.close()
+
+
+# ---------------------------------------
+# Report
+# ---------------------------------------
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return float("nan")
+    k = max(0, min(len(values) - 1, round(p / 100 * (len(values) - 1))))
+    return values[k]
+
+
+def print_report(records, errors, elapsed, rss_samples):
+    print(f"\nReruns: {len(records)} in {elapsed:.1f}s → {len(records) / elapsed:.2f} reruns/s")
+    print(f"Errors: {len(errors)}")
+    for e in sorted(set(errors))[:10]:
+        print(f"  {errors.count(e)} × {e}")
+    if not records:
+        # e.g. no session could connect: nothing to summarize
+        return
+
+    by_step = {}
+    for _, name, latency in records:
+        by_step.setdefault(name, []).append(latency * 1000)
+    by_step["ALL"] = [lat * 1000 for _, _, lat in records]
+
+    print(f"\n{'step':45} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, lat in sorted(by_step.items(), key=lambda kv: kv[0] == "ALL"):
+        print(f"{name[:45]:45} {len(lat):6d} {percentile(lat, 50):9.0f} {percentile(lat, 95):9.0f} "
+              f"{percentile(lat, 99):9.0f} {max(lat):9.0f}")
+
+    if rss_samples:
+        rss = [mb for _, mb in rss_samples]
+        print(f"\nServer RSS (MB): start {rss[0]:.0f}, peak {max(rss):.0f}, "
+              f"end {rss[-1]:.0f}, mean {statistics.mean(rss):.0f}")
+
+
+def write_csv(path, records, rss_samples, t0):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["kind", "t_s", "name", "value"])
+        for t, name, latency in records:
+            writer.writerow(["latency_ms", round(t - t0, 3), name, round(latency * 1000, 1)])
+        for t, mb in rss_samples:
+            writer.writerow(["rss_mb", round(t, 3), "", round(mb, 1)])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.loadtest", description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=60, help="seconds of load")
+    parser.add_argument("--ramp", type=float, default=5, help="seconds to start all sessions")
+    parser.add_argument("--scenario", help="JSON scenario file (default: tour of every page)")
+    parser.add_argument("--url", help="use a running server instead of starting one")
+    parser.add_argument("--pid", type=int, help="server pid for RSS sampling with --url")
+    parser.add_argument("--port", type=int, default=8599)
+    parser.add_argument("--rss-interval", type=float, default=1.0)
+    parser.add_argument("--csv", help="write latency and RSS samples to this file")
+    args = parser.parse_args(argv)
+
+    scenario = DEFAULT_SCENARIO
+    if args.scenario:
+        with open(args.scenario) as f:
+            scenario = json.load(f)
+
+    proc = None
+    if args.url:
+        url, pid = args.url.rstrip("/"), args.pid
+    else:
+        proc, url = start_server(args.port)
+        pid = proc.pid
+
+    sampler = RssSampler(pid, args.rss_interval) if pid else None
+    if sampler:
+        sampler.start()
+
+    records, errors = [], []
+    t0 = time.monotonic()
+    deadline = t0 + args.ramp + args.duration
+
+    async def run_all():
+        await asyncio.gather(*(
+            run_session(url, scenario, deadline, records, errors, args.ramp * i / max(1, args.sessions))
+            for i in range(args.sessions)
+        ))
+
+    try:
+        asyncio.run(run_all())
+    finally:
+        elapsed = time.monotonic() - t0
+        if sampler:
+            sampler.stopped.set()
+            sampler.join()
+        if proc:
+            proc.terminate()
+            proc.wait()
+
+    rss_samples = sampler.samples if sampler else []
+    print_report(records, errors, elapsed, rss_samples)
+    if args.csv:
+        write_csv(args.csv, records, rss_samples, t0)
+    return 1 if not records else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------
+# Day-by-day cumulative medal race
+# ---------------------------------------
+# Medal rows are folded once into a dense int32 array
+#   counts[medal type, day, NOC]  (cumulative up to and including the day)
+# so any day's standings are an array slice and a lexsort, and animation
+# frames are built from slices without touching the DataFrame again.
+MEDAL_TYPES = ["Gold", "Silver", "Bronze"]
+TOP_N = 15
+
+# medals.csv codes the event gender (M, W, X mixed, O open); the global
+# filter selects medallist genders
+GENDER_CODES = {"Male": ["M"], "Female": ["W"]}
+
+
+def medal_rows_filters(filters):
+    """Global filters translated to medals.csv gender codes.
+
+    Mixed and open events count only when both genders are selected.
+    """
+    genders = filters["selected_genders"]
+    if not genders:
+        return filters
+    codes = [code for g in genders for code in GENDER_CODES.get(g, [g])]
+    if all(g in genders for g in GENDER_CODES):
+        codes += ["X", "O"]
+    return {**filters, "selected_genders": codes}
+
+
+def build_medal_race(medals):
+    """Dense cumulative medal counts per day and NOC.
+
+    Returns {"days", "nocs", "countries", "counts"}: every calendar day from
+    the first to the last medal day, NOCs sorted by code, and counts with
+    shape (3, n_days, n_nocs) in MEDAL_TYPES order.
+    """
+    df = medals.dropna(subset=["medal_date", "country_code"])
+    df = df[df["medal_type"].isin(MEDAL_TYPES)]
+    if df.empty:
+        return {"days": [], "nocs": np.array([], dtype=object), "countries": np.array([], dtype=object),
+                "counts": np.zeros((len(MEDAL_TYPES), 0, 0), dtype=np.int32)}
+
+    dates = pd.to_datetime(df["medal_date"]).dt.normalize()
+    days = pd.date_range(dates.min(), dates.max(), freq="D")
+    day_idx = (dates - days[0]).dt.days.to_numpy()
+    noc_idx, nocs = pd.factorize(df["country_code"], sort=True)
+    type_idx = pd.Categorical(df["medal_type"], categories=MEDAL_TYPES).codes
+
+    counts = np.zeros((len(MEDAL_TYPES), len(days), len(nocs)), dtype=np.int32)
+    np.add.at(counts, (type_idx, day_idx, noc_idx), 1)
+    np.cumsum(counts, axis=1, out=counts)
+
+    name_col = "country" if "country" in df.columns else "country_code"
+    countries = df.groupby("country_code")[name_col].first().reindex(nocs).to_numpy()
+    return {"days": [d.date() for d in days], "nocs": np.asarray(nocs), "countries": countries, "counts": counts}
+
+
+def standings(race, day, scheme="total"):
+    """NOC column indices for one day, best first.
+
+    "total" ranks by total then gold/silver/bronze; "gold" by gold first.
+    Ties keep NOC code order.
+    """
+    gold, silver, bronze = race["counts"][:, day]
+    if scheme == "gold":
+        return np.lexsort((-bronze, -silver, -gold))
+    return np.lexsort((-bronze, -silver, -gold, -(gold + silver + bronze)))
+
+
+def standings_table(race, day, scheme="total"):
+    order = standings(race, day, scheme)
+    gold, silver, bronze = race["counts"][:, day, order]
+    table = pd.DataFrame({
+        "country_code": race["nocs"][order],
+        "country": race["countries"][order],
+        "Gold": gold,
+        "Silver": silver,
+        "Bronze": bronze,
+        "Total": gold + silver + bronze,
+    })
+    return table[table["Total"] > 0].reset_index(drop=True)
+
+
+def race_frames(race, n=TOP_N, scheme="total"):
+    """Top-n slices per day, keeping only what changed since the day before.
+
+    Each frame is {"day", "order", "x"}: `order` (NOC indices, best first)
+    is None when the top n is unchanged, and `x` maps a medal type index to
+    its counts only for types whose values changed. The first frame is
+    always complete, so playback can restart from it.
+    """
+    frames = []
+    prev_order, prev_values = None, None
+    for d, day in enumerate(race["days"]):
+        order = standings(race, d, scheme)[:n]
+        values = race["counts"][:, d, order]
+
+        order_changed = prev_order is None or not np.array_equal(order, prev_order)
+        x = {
+            t: values[t] for t in range(len(MEDAL_TYPES))
+            if order_changed or not np.array_equal(values[t], prev_values[t])
+        }
+        frames.append({"day": day, "order": order if order_changed else None, "x": x})
+        prev_order, prev_values = order, values
+    return frames
@@ -1,4 +1,7 @@
 import os
+import glob
+import hashlib
+import time
 import pandas as pd
 import pycountry
 import pycountry_convert as pc
@@ -9,6 +12,33 @@ import re
 # Paths
 # ---------------------------------------
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+RESULTS_DIR = os.path.join(DATA_DIR, "results")
+
+
+# Seconds a computed data version is reused before the files are stat'ed again
+DATA_VERSION_TTL = 2.0
+_data_version = (None, 0.0)  # (version, monotonic time computed)
+
+
+def data_version(max_age=DATA_VERSION_TTL):
+    """Short signature of every data file (path, size, mtime).
+
+    Reused for `max_age` seconds, so per-request callers do not stat every
+    file each time; pass max_age=0 to force a fresh signature.
+    """
+    global _data_version
+    version, computed_at = _data_version
+    now = time.monotonic()
+    if version is not None and now - computed_at < max_age:
+        return version
+
+    h = hashlib.sha1()
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, "**", "*.csv"), recursive=True)):
+        st = os.stat(path)
+        h.update(f"{os.path.relpath(path, DATA_DIR)}:{st.st_size}:{st.st_mtime_ns}".encode())
+    version = h.hexdigest()[:12]
+    _data_version = (version, now)
+    return version
 
 # ---------------------------------------
 # Continent mapping
@@ -48,22 +78,21 @@ def get_continent_from_noc(noc):
         return "Other"
 
 def add_continent_column(df, col="country_code"):
-    df = df.copy()
-    df["continent"] = df[col].apply(get_continent_from_noc)
-    return df
+    # One lookup per distinct NOC; assign() shares the existing columns
+    continents = {noc: get_continent_from_noc(noc) for noc in df[col].unique()}
+    return df.assign(continent=df[col].map(continents))
 
 # ---------------------------------------
 # Clean Medal Type
 # ---------------------------------------
 def clean_medal_type(df, col="medal_type"):
-    df = df.copy()
     mapping = {
         "Gold Medal": "Gold", "GOLD": "Gold", "Gold": "Gold",
         "Silver Medal": "Silver", "SILVER": "Silver", "Silver": "Silver",
         "Bronze Medal": "Bronze", "BRONZE": "Bronze", "Bronze": "Bronze",
     }
     if col in df.columns:
-        df[col] = df[col].map(mapping).fillna(df[col])
+        df = df.assign(**{col: df[col].map(mapping).fillna(df[col])})
     return df
 
 # ---------------------------------------
@@ -97,6 +126,14 @@ def prepare_medals_datasets():
     return medals_total, medallists, medals
 
 
+def load_results():
+    """Loads every per-discipline results file into one frame."""
+    files = sorted(glob.glob(os.path.join(RESULTS_DIR, "*.csv")))
+    results = pd.concat([pd.read_csv(f) for f in files], ignore_index=True)
+    results["participant_code"] = results["participant_code"].astype(str)
+    return results
+
+
 
 
 
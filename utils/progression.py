@@ -0,0 +1,155 @@
+import os
+import re
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------
+# Round keys
+# ---------------------------------------
+# stage_code = event_code padded to 22 chars + 4-char phase + unit number,
+# e.g. "SWMM100MBA------------HEAT000100--" → phase "HEAT".
+PHASE_SLICE = slice(22, 26)
+
+# Bracket phases in competition order; blank phases are "Final Results".
+# Timestamps are not reliable enough to order rounds on their own (finals
+# dated before semi-finals), so they only order rounds within a rank.
+PHASE_RANKS = {"8FNL": 1, "QFNL": 2, "SFNL": 3, "FNL": 4, "": 5}
+
+PATH_COLUMNS = [
+    "event_code", "event_name", "discipline_name", "round_order", "round",
+    "stage", "stage_code", "date", "participant_code", "participant_name",
+    "participant_country_code", "rank", "result", "result_type",
+    "result_IRM", "qualification_mark", "advanced",
+]
+
+
+def _round_label(stages):
+    """Common name of the stages of one round ("Heat 1", "Heat 2" → "Heat")."""
+    names = sorted(stages.dropna().unique())
+    if len(names) == 1:
+        return names[0]
+    label = os.path.commonprefix(names).rstrip(" -0123456789")
+    # Only strip numbering ("Heat 3", "Group B"), not names ("For Gold" / "For Bronze")
+    if label and all(re.fullmatch(r"[\s\-]*(\d+|[A-Z])", n[len(label):]) for n in names):
+        return label
+    if len(names) <= 4:
+        return " / ".join(names)
+    return label or names[0]
+
+
+def _slices(keys):
+    """Map each key of a sorted array to its (start, stop) positions."""
+    values, starts = np.unique(keys, return_index=True)
+    stops = np.append(starts[1:], len(keys))
+    return dict(zip(values, zip(starts, stops)))
+
+
+# ---------------------------------------
+# Index construction
+# ---------------------------------------
+def build_progression_index(results):
+    """Precompute round ordering and every participant's path per event.
+
+    Returns a dict with:
+    - "rounds": one row per (event_code, round_order)
+    - "paths": result rows sorted by (participant_code, event_code, round_order)
+    - "entries": one row per (event_code, participant_code)
+    - "by_event" / "by_entry_event" / "by_participant": key → (start, stop)
+      row slices into the frames above
+    """
+    df = results.copy(deep=False)
+    df["phase"] = df["stage_code"].str[PHASE_SLICE].str.rstrip("-")
+    df["date"] = pd.to_datetime(df["date"], errors="coerce", utc=True)
+    # "Final Results" (blank phase) is the overall classification of every
+    # entrant; next to a real final it is not a round anyone advanced to
+    has_final = df["phase"].eq("FNL").groupby(df["event_code"]).transform("any")
+    df = df[~(has_final & df["phase"].eq(""))]
+
+    rounds = (
+        df.groupby(["event_code", "phase"])
+        .agg(
+            event_name=("event_name", "first"),
+            discipline_name=("discipline_name", "first"),
+            round=("stage", _round_label),
+            start=("date", "min"),
+            n_stages=("stage_code", "nunique"),
+            n_participants=("participant_code", "nunique"),
+        )
+        .reset_index()
+        .sort_values(["event_code", "start", "phase"])
+    )
+    # Other phases (qualification, heats, groups, repechages, combined-event
+    # disciplines) take the rank of the bracket phase before them, never FNL's
+    rank = rounds["phase"].map(PHASE_RANKS)
+    inherited = rank.groupby(rounds["event_code"]).ffill().fillna(0).clip(upper=PHASE_RANKS["FNL"] - 1)
+    rounds["phase_rank"] = rank.fillna(inherited)
+    rounds = rounds.sort_values(["event_code", "phase_rank", "start", "phase"])
+    rounds["round_order"] = rounds.groupby("event_code").cumcount() + 1
+    rounds["is_last_round"] = (
+        rounds["round_order"] == rounds.groupby("event_code")["round_order"].transform("max")
+    )
+
+    df = df.merge(
+        rounds[["event_code", "phase", "round", "round_order"]],
+        on=["event_code", "phase"],
+        how="left",
+    )
+
+    # A participant advanced if they show up again in a later round
+    last_round = df.groupby(["event_code", "participant_code"])["round_order"].transform("max")
+    df["advanced"] = df["round_order"] < last_round
+
+    paths = df.sort_values(
+        ["participant_code", "event_code", "round_order", "date"]
+    ).reset_index(drop=True)[PATH_COLUMNS]
+
+    rounds = rounds.reset_index(drop=True)
+
+    # One row per (event, participant), furthest round first
+    entries = (
+        df.groupby(["event_code", "participant_code"])
+        .agg(
+            participant_name=("participant_name", "first"),
+            participant_country_code=("participant_country_code", "first"),
+            furthest_round=("round_order", "max"),
+        )
+        .reset_index()
+        .sort_values(
+            ["event_code", "furthest_round", "participant_name"],
+            ascending=[True, False, True],
+        )
+        .reset_index(drop=True)
+    )
+
+    return {
+        "rounds": rounds,
+        "paths": paths,
+        "entries": entries,
+        "by_event": _slices(rounds["event_code"].to_numpy()),
+        "by_entry_event": _slices(entries["event_code"].to_numpy()),
+        "by_participant": _slices(paths["participant_code"].to_numpy()),
+    }
+
+
+# ---------------------------------------
+# Lookups
+# ---------------------------------------
+def event_rounds(index, event_code):
+    """Ordered rounds of one event."""
+    start, stop = index["by_event"].get(event_code, (0, 0))
+    return index["rounds"].iloc[start:stop]
+
+
+def event_participants(index, event_code):
+    """Participants of one event, furthest round first."""
+    start, stop = index["by_entry_event"].get(event_code, (0, 0))
+    return index["entries"].iloc[start:stop]
+
+
+def participant_path(index, participant_code, event_code=None):
+    """Round-by-round results of one participant (optionally one event)."""
+    start, stop = index["by_participant"].get(str(participant_code), (0, 0))
+    path = index["paths"].iloc[start:stop]
+    if event_code is not None:
+        path = path[path["event_code"] == event_code]
+    return path
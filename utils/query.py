@@ -0,0 +1,219 @@
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+from utils.preprocessing import (
+    DATA_DIR,
+    prepare_medals_datasets,
+    normalize_name,
+    load_results,
+    data_version,
+)
+from utils.filters import apply_global_filters
+from utils.progression import build_progression_index, event_rounds, participant_path
+from utils.leaderboard import (
+    MEDAL_COLUMNS,
+    RANKING_SCHEMES,
+    medal_count_cube,
+    counts_from_cube,
+    build_leaderboard,
+)
+
+# ---------------------------------------
+# Headless query API
+# ---------------------------------------
+# Same preprocessing as the Streamlit pages, without a Streamlit session.
+# Every dataset is loaded once per process; queries only slice/aggregate.
+
+MEDAL_DIMENSIONS = ["country", "continent", "discipline", "gender"]
+
+# medals.csv codes the event's gender; names match the medallists' genders
+EVENT_GENDERS = {"M": "Male", "W": "Female", "X": "Mixed", "O": "Open"}
+# Events open to both genders are kept whenever a gender filter is set
+SHARED_GENDERS = ["Mixed", "Open"]
+
+_loaded_version = None
+
+
+def refresh_if_changed():
+    """Drop every loaded dataset if a data file changed. Returns the version."""
+    global _loaded_version
+    version = data_version()
+    if version != _loaded_version:
+        load_table.cache_clear()
+        load_datasets.cache_clear()
+        load_progression.cache_clear()
+        _loaded_version = version
+    return version
+
+
+@lru_cache(maxsize=None)
+def load_table(name):
+    """Raw data/<name>.csv, read once per process."""
+    return pd.read_csv(os.path.join(DATA_DIR, f"{name}.csv"))
+
+
+@lru_cache(maxsize=None)
+def load_datasets():
+    """Preprocessed frames shared by every query."""
+    medals_total, medallists, medals = prepare_medals_datasets()
+    medallists["name_norm"] = medallists["name"].apply(normalize_name)
+    # One row per medal: a team medal counts once, not once per athlete
+    medal_rows = medals.assign(gender=medals["gender"].map(EVENT_GENDERS))
+
+    schedules = load_table("schedules").copy(deep=False)
+    schedules["start_date"] = pd.to_datetime(schedules["start_date"])
+    schedules["end_date"] = pd.to_datetime(schedules["end_date"])
+    schedules = schedules.dropna(subset=["start_date", "end_date"])
+    schedules = schedules.sort_values("start_date").reset_index(drop=True)
+    schedules["duration_days"] = (
+        schedules["end_date"] - schedules["start_date"]
+    ).dt.total_seconds() / (24 * 3600)
+
+    return {
+        "medals_total": medals_total,
+        "medallists": medallists,
+        "medals": medals,
+        "medal_cube": medal_count_cube(medal_rows),
+        "schedules": schedules,
+    }
+
+
+@lru_cache(maxsize=None)
+def load_progression():
+    """Event progression index over all results files."""
+    return build_progression_index(load_results())
+
+
+def make_filters(countries=None, continents=None, disciplines=None,
+                 medal_types=None, genders=None):
+    """Build the filter dict used by `apply_global_filters`."""
+    return {
+        "continent": continents,
+        "country_col": "country_code",
+        "selected_countries": countries,
+        "sport_col": "discipline",
+        "selected_sports": disciplines,
+        "selected_medal_types": medal_types,
+        "selected_genders": genders,
+    }
+
+
+def filters_to_params(filters):
+    """Inverse of `make_filters` for a sidebar filter dict."""
+    return {
+        "country": filters["selected_countries"],
+        "continent": filters["continent"],
+        "discipline": filters["selected_sports"],
+        "medal_type": filters["selected_medal_types"],
+        "gender": filters["selected_genders"],
+    }
+
+
+# ---------------------------------------
+# Queries
+# ---------------------------------------
+def medals_by(dimension="country", scheme="total", **filters):
+    """Medal table (Gold/Silver/Bronze/Total) grouped by one dimension.
+
+    Counts medals (medals.csv), not medallists: a relay gold is one gold.
+    """
+    if dimension not in MEDAL_DIMENSIONS:
+        raise ValueError(f"dimension must be one of {MEDAL_DIMENSIONS}")
+    if scheme not in RANKING_SCHEMES:
+        raise ValueError(f"scheme must be one of {list(RANKING_SCHEMES)}")
+
+    if filters.get("genders"):
+        filters = {**filters, "genders": list(filters["genders"]) + SHARED_GENDERS}
+    cube = apply_global_filters(load_datasets()["medal_cube"], make_filters(**filters))
+
+    if dimension == "country":
+        return build_leaderboard(counts_from_cube(cube))[scheme]
+
+    table = counts_from_cube(cube, keys=[dimension])
+    for m in MEDAL_COLUMNS:
+        if m not in table.columns:
+            table[m] = 0
+    table["Total"] = table[MEDAL_COLUMNS].sum(axis=1)
+    table = table[[dimension] + MEDAL_COLUMNS + ["Total"]]
+    return table.sort_values("Total", ascending=False).reset_index(drop=True)
+
+
+def athlete_profile(name):
+    """One-row profile of an athlete with their personal medal count."""
+    athletes = load_table("athletes")
+    medallists = load_datasets()["medallists"]
+
+    norm = normalize_name(name)
+    match = athletes[athletes["name"].apply(normalize_name) == norm]
+    if match.empty:
+        raise KeyError(f"Unknown athlete: {name}")
+
+    profile = match.iloc[[0]].reset_index(drop=True)
+    medal_counts = medallists.loc[medallists["name_norm"] == norm, "medal_type"].value_counts()
+    for m in MEDAL_COLUMNS:
+        profile[m] = int(medal_counts.get(m, 0))
+    profile["Total"] = profile[MEDAL_COLUMNS].sum(axis=1)
+    return profile
+
+
+def schedule_window(start, end, discipline=None, venue=None):
+    """Sessions overlapping [start, end), in start order.
+
+    Naive timestamps are read in the schedule's own (Paris) time zone.
+    """
+    schedules = load_datasets()["schedules"]
+    tz = schedules["start_date"].dt.tz
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    if start.tzinfo is None:
+        start = start.tz_localize(tz)
+    if end.tzinfo is None:
+        end = end.tz_localize(tz)
+
+    # Schedule is pre-sorted by start: only the prefix starting before `end` can overlap
+    stop = schedules["start_date"].searchsorted(end, side="left")
+    window = schedules.iloc[:stop]
+    window = window[window["end_date"] > start]
+
+    if discipline:
+        window = window[window["discipline"] == discipline]
+    if venue:
+        window = window[window["venue"] == venue]
+    return window
+
+
+def venue_load(start=None, end=None, discipline=None):
+    """Total session duration (days) and session count per venue."""
+    schedules = load_datasets()["schedules"]
+    if start is not None or end is not None:
+        schedules = schedule_window(
+            start if start is not None else schedules["start_date"].min(),
+            end if end is not None else schedules["end_date"].max(),
+            discipline=discipline,
+        )
+    elif discipline:
+        schedules = schedules[schedules["discipline"] == discipline]
+
+    load = schedules.groupby("venue").agg(
+        duration_days=("duration_days", "sum"),
+        sessions=("duration_days", "size"),
+    ).reset_index()
+    load["duration_days"] = load["duration_days"].round(2)
+    return load.sort_values("duration_days", ascending=False).reset_index(drop=True)
+
+
+def event_progression(event_code):
+    """Ordered rounds of one event."""
+    rounds = event_rounds(load_progression(), event_code)
+    if rounds.empty:
+        raise KeyError(f"Unknown event: {event_code}")
+    return rounds
+
+
+def participant_progression(participant_code, event_code=None):
+    """Round-by-round path of one participant."""
+    path = participant_path(load_progression(), participant_code, event_code)
+    if path.empty:
+        raise KeyError(f"Unknown participant: {participant_code}")
+    return path
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+# ---------------------------------------
+# Pre-sorted index over data/results/*.csv
+# ---------------------------------------
+# Sort orders for the common keys are computed once as row permutations;
+# a query is then a boolean mask (filters + substring search) applied along
+# one permutation, and only the requested page of rows is materialized.
+DISPLAY_COLUMNS = [
+    "date", "discipline_name", "event_name", "stage",
+    "participant_name", "participant_country_code", "participant_country",
+    "rank", "result", "result_type", "qualification_mark", "venue",
+]
+
+# Sort key → columns (primary first); later columns break ties
+SORT_KEYS = {
+    "discipline": ["discipline_name", "event_name", "date", "rank"],
+    "event": ["event_name", "discipline_name", "date", "rank"],
+    "noc": ["participant_country_code", "date", "rank"],
+    "rank": ["rank", "date"],
+    "date": ["date", "discipline_name", "event_name", "rank"],
+}
+
+SEARCH_COLUMNS = ["participant_name", "participant_country", "event_name", "discipline_name"]
+
+
+def _sort_codes(col, descending=False):
+    """Dense integer codes in sort order; missing values always sort last."""
+    codes, uniques = pd.factorize(col, sort=True)
+    n = len(uniques)
+    if descending:
+        codes = np.where(codes < 0, -1, n - 1 - codes)
+    return np.where(codes < 0, n, codes)
+
+
+def build_results_index(results):
+    """Display frame, per-key sort permutations and a lowercase search blob."""
+    df = results.reindex(columns=DISPLAY_COLUMNS).reset_index(drop=True)
+    df["date"] = pd.to_datetime(df["date"], errors="coerce", utc=True)
+    # Results mix numbers and text across disciplines
+    df["result"] = df["result"].where(df["result"].isna(), df["result"].astype(str))
+
+    codes = {col: _sort_codes(df[col]) for col in {c for cols in SORT_KEYS.values() for c in cols}}
+    orders = {}
+    for key, cols in SORT_KEYS.items():
+        # lexsort: last key is primary; descending flips only the primary key
+        ties = [codes[c] for c in reversed(cols[1:])]
+        orders[key] = {
+            False: np.lexsort(ties + [codes[cols[0]]]),
+            True: np.lexsort(ties + [_sort_codes(df[cols[0]], descending=True)]),
+        }
+
+    blob = df[SEARCH_COLUMNS[0]].fillna("").astype(str)
+    for col in SEARCH_COLUMNS[1:]:
+        blob = blob + "\x1f" + df[col].fillna("").astype(str)
+
+    return {
+        "frame": df,
+        "orders": orders,
+        "search": blob.str.lower().to_numpy(dtype=object),
+        "disciplines": sorted(df["discipline_name"].dropna().unique()),
+        "nocs": sorted(df["participant_country_code"].dropna().unique()),
+    }
+
+
+def query_results(index, sort="date", descending=False, discipline=None, noc=None,
+                  search="", page=1, page_size=50):
+    """One page of rows (1-based) and the number of matching rows."""
+    if sort not in index["orders"]:
+        raise KeyError(f"Unknown sort key: {sort}")
+    df = index["frame"]
+
+    mask = np.ones(len(df), dtype=bool)
+    if discipline:
+        mask &= (df["discipline_name"] == discipline).to_numpy()
+    if noc:
+        mask &= (df["participant_country_code"] == noc).to_numpy()
+    if search:
+        needle = search.lower().strip()
+        mask &= np.fromiter((needle in s for s in index["search"]), dtype=bool, count=len(df))
+
+    order = index["orders"][sort][descending]
+    rows = order[mask[order]]
+
+    start = (page - 1) * page_size
+    return df.iloc[rows[start:start + page_size]], len(rows)
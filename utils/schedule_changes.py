@@ -0,0 +1,286 @@
+import datetime
+import os
+import threading
+
+import pandas as pd
+
+from utils.preprocessing import DATA_DIR
+
+# ---------------------------------------
+# Preliminary vs final schedule reconciliation
+# ---------------------------------------
+# Both schedules are normalized to one keyed form (venue, discipline, UTC
+# start) and paired within each (venue, discipline): first on the exact
+# start, then final units falling inside a preliminary session's [start,
+# end] (the final schedule lists single bouts or matches where the
+# preliminary one lists a whole session), then the rest of each local day by
+# nearest start. Only what is still unpaired was cancelled or added.
+#
+# The diff is kept per (venue, discipline) partition with a digest of each
+# side's rows, so when either file is refreshed only partitions whose rows
+# changed are diffed again.
+PRELIMINARY_PATH = os.path.join(DATA_DIR, "schedules_preliminary.csv")
+FINAL_PATH = os.path.join(DATA_DIR, "schedules.csv")
+SCHEDULE_TZ = "Europe/Paris"
+
+KEY = ["venue_code", "discipline_code"]
+COLUMNS = KEY + ["venue", "discipline", "day", "start", "end", "label", "cancelled"]
+CHANGE_TYPES = ["unchanged", "within", "moved", "added", "cancelled"]
+
+
+# ---------------------------------------
+# Normalization
+# ---------------------------------------
+def _common(df):
+    # Missing codes (e.g. ceremonies) must still hash and join as keys
+    df = df.fillna({col: "" for col in KEY + ["venue", "discipline", "label"]})
+    df = df.assign(day=df["start"].dt.tz_convert(SCHEDULE_TZ).dt.date)
+    return df[COLUMNS].sort_values(KEY + ["start"], kind="stable").reset_index(drop=True)
+
+
+def normalize_preliminary(df):
+    """schedules_preliminary.csv in the common keyed form."""
+    # Sessions away from the sport's main venue carry their venue in the
+    # *_other columns and the session name in `description`
+    away = df["venue_code"].isna() & df["venue_code_other"].notna()
+    teams = df["team_1"].fillna("") + " – " + df["team_2"].fillna("")
+    return _common(pd.DataFrame({
+        "venue_code": df["venue_code"].where(~away, df["venue_code_other"]),
+        "discipline_code": df["sport_code"],
+        "venue": df["description"].where(~away, df["discription_other"]),
+        "discipline": df["sport"],
+        "start": pd.to_datetime(df["date_start_utc"], utc=True),
+        "end": pd.to_datetime(df["date_end_utc"], utc=True),
+        "label": df["description"].where(away, teams.where(df["team_1"].notna() | df["team_2"].notna())),
+        "cancelled": False,
+    }))
+
+
+def normalize_final(df):
+    """schedules.csv in the common keyed form."""
+    return _common(pd.DataFrame({
+        "venue_code": df["venue_code"],
+        "discipline_code": df["discipline_code"],
+        "venue": df["venue"],
+        "discipline": df["discipline"],
+        "start": pd.to_datetime(df["start_date"], utc=True),
+        "end": pd.to_datetime(df["end_date"], utc=True),
+        "label": df["phase"].fillna(""),
+        "cancelled": df["status"] == "CANCELLED",
+    }))
+
+
+# ---------------------------------------
+# Diff
+# ---------------------------------------
+def _pair(left, right, on):
+    """Row labels of `left` and `right` paired on `on` (hash join).
+
+    Duplicate keys pair in order: the n-th left row with the n-th right row.
+    """
+    lkeys = left[on].assign(_n=left.groupby(on, sort=False).cumcount(), _left=left.index)
+    rkeys = right[on].assign(_n=right.groupby(on, sort=False).cumcount(), _right=right.index)
+    pairs = lkeys.merge(rkeys, on=on + ["_n"], how="inner")
+    return pairs["_left"].to_numpy(), pairs["_right"].to_numpy()
+
+
+def _candidates(left, right, on):
+    """Every (left, right) row pair sharing `on`, with both sides' times."""
+    return (
+        left[on + ["start", "end"]].assign(_left=left.index)
+        .merge(right[on + ["start", "end"]].assign(_right=right.index), on=on, suffixes=("_l", "_r"))
+    )
+
+
+def _session_spans(prelim):
+    """Preliminary sessions with `end` stretched to the next session's start.
+
+    The preliminary schedule lists the first slot of each block (a 7-minute
+    bout at 08:00, the next at 10:20), so a session is taken to run until
+    the next one of its venue, discipline and day starts; the last one of
+    the day keeps its own end.
+    """
+    next_start = prelim.groupby(KEY + ["day"])["start"].shift(-1)
+    return prelim.assign(end=prelim["end"].where(next_start.isna() | (next_start < prelim["end"]), next_start))
+
+
+def _pair_within(prelim, final):
+    """Final units inside or overlapping a preliminary session.
+
+    Returns (final-unit pairs as preliminary and final labels, labels of
+    every preliminary session holding a unit). Each unit goes to the session
+    it overlaps most, then to the one starting nearest; parallel sessions
+    (two mats at 08:00) all count as held. A zero-length session or unit
+    matches when its instant lies within the other interval.
+    """
+    pairs = _candidates(_session_spans(prelim), final, KEY)
+    lo = pairs[["start_l", "start_r"]].max(axis=1)
+    hi = pairs[["end_l", "end_r"]].min(axis=1)
+    instant = pairs["end_l"].le(pairs["start_l"]) | pairs["end_r"].le(pairs["start_r"])
+    pairs = pairs.assign(
+        _overlap=hi - lo,
+        _distance=(pairs["start_r"] - pairs["start_l"]).abs(),
+    )[(lo < hi) | (instant & (lo <= hi))]
+    best = pairs.sort_values(["_overlap", "_distance"], ascending=[False, True], kind="stable")
+    best = best.drop_duplicates("_right")
+    return best["_left"].to_numpy(), best["_right"].to_numpy(), pd.unique(pairs["_left"])
+
+
+def _pair_nearest(left, right, on):
+    """Row labels of `left` and `right` paired one-to-one on `on`, nearest start first."""
+    pairs = _candidates(left, right, on)
+    pairs = pairs.assign(_distance=(pairs["start_r"] - pairs["start_l"]).abs())
+    pairs = pairs.sort_values(["_distance", "start_l"], kind="stable")
+    # Greedy: closest remaining pair first; rows already paired drop out
+    used_left, used_right, lefts, rights = set(), set(), [], []
+    for l, r in zip(pairs["_left"].to_numpy(), pairs["_right"].to_numpy()):
+        if l not in used_left and r not in used_right:
+            used_left.add(l)
+            used_right.add(r)
+            lefts.append(l)
+            rights.append(r)
+    return lefts, rights
+
+
+def _log_rows(change, prelim=None, final=None):
+    """Change-log rows from aligned preliminary and/or final rows."""
+    base = (final if final is not None else prelim).reset_index(drop=True)
+    out = base[KEY + ["venue", "discipline", "day", "label"]]
+    out.insert(0, "change", change)
+    for side, df in (("prelim", prelim), ("final", final)):
+        for col in ("start", "end"):
+            out[f"{col}_{side}"] = (
+                df[col].array if df is not None
+                else pd.Series(pd.NaT, index=out.index, dtype=base[col].dtype)
+            )
+    out["cancelled"] = final["cancelled"].to_numpy() if final is not None else False
+    return out
+
+
+def reconcile(prelim, final):
+    """Change log of two normalized schedules, one row per session.
+
+    `change` is "unchanged" (same start; the end may differ), "within" (a
+    final unit inside or overlapping a preliminary session, which the final
+    schedule split into finer units; or a parallel preliminary session
+    whose units all went to its twin), "moved" (same venue, discipline and
+    local day, paired by nearest start), "added" or "cancelled" (missing
+    from the final schedule, or marked CANCELLED in it).
+    """
+    # 1. Same venue, discipline and start
+    p_exact, f_exact = _pair(prelim, final, KEY + ["start"])
+    # 2. Final units inside a preliminary session of the venue and discipline
+    final_left = final.drop(f_exact)
+    p_within, f_within, p_held = _pair_within(prelim, final_left)
+    # Parallel sessions whose units all went to a twin are within too
+    p_shared = pd.Index(p_held).difference(pd.Index(p_exact)).difference(pd.Index(p_within))
+    prelim_left = prelim.drop(p_exact).drop(p_held, errors="ignore")
+    final_left = final_left.drop(f_within)
+    # 3. Same venue, discipline and day: the session moved within the day
+    p_moved, f_moved = _pair_nearest(prelim_left, final_left, KEY + ["day"])
+
+    log = pd.concat([
+        _log_rows("unchanged", prelim.loc[p_exact], final.loc[f_exact]),
+        _log_rows("within", prelim.loc[p_within], final.loc[f_within]),
+        _log_rows("within", prelim=prelim.loc[p_shared]),
+        _log_rows("moved", prelim.loc[p_moved], final.loc[f_moved]),
+        _log_rows("cancelled", prelim=prelim_left.drop(p_moved)),
+        _log_rows("added", final=final_left.drop(f_moved)),
+    ], ignore_index=True)
+
+    # Sessions kept in the final schedule but marked CANCELLED there
+    log.loc[log.pop("cancelled").to_numpy(dtype=bool), "change"] = "cancelled"
+
+    log["shift_minutes"] = (log["start_final"] - log["start_prelim"]).dt.total_seconds() / 60
+    return log
+
+
+def change_summary(log):
+    """Session counts per venue, discipline and change type."""
+    return (
+        log.groupby(["venue", "discipline", "change"]).size()
+        .unstack("change", fill_value=0)
+        .reindex(columns=CHANGE_TYPES, fill_value=0)
+        .reset_index()
+        .rename_axis(columns=None)
+    )
+
+
+# ---------------------------------------
+# Incremental tracker
+# ---------------------------------------
+_lock = threading.Lock()
+_sources = {}  # path → (signature, normalized frame)
+_digests = {}  # partition → (preliminary digest, final digest)
+_log = None
+_runs = []
+
+
+def _signature(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def _load(path, normalize):
+    """Normalized file and whether it changed since the last load."""
+    signature = _signature(path)
+    cached = _sources.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1], False
+    df = normalize(pd.read_csv(path))
+    _sources[path] = (signature, df)
+    return df, True
+
+
+def partition_digests(df):
+    """{(venue_code, discipline_code): order-insensitive digest of its rows}."""
+    if df.empty:
+        return {}
+    row_hashes = pd.util.hash_pandas_object(df[COLUMNS], index=False)
+    return row_hashes.groupby([df[k] for k in KEY]).sum().to_dict()
+
+
+def _in(df, partitions):
+    return df[pd.MultiIndex.from_frame(df[KEY]).isin(list(partitions))]
+
+
+def schedule_changes():
+    """Current change log and the history of reconciliation runs.
+
+    Cheap when neither file changed (two stat calls). Otherwise only the
+    partitions whose preliminary or final rows changed are diffed again.
+    """
+    global _log
+    with _lock:
+        prelim, prelim_changed = _load(PRELIMINARY_PATH, normalize_preliminary)
+        final, final_changed = _load(FINAL_PATH, normalize_final)
+
+        if _log is None or prelim_changed or final_changed:
+            p_digests, f_digests = partition_digests(prelim), partition_digests(final)
+            digests = {k: (p_digests.get(k), f_digests.get(k)) for k in set(p_digests) | set(f_digests)}
+            stale = {k for k, d in digests.items() if _digests.get(k) != d}
+
+            kept = _log if _log is not None else reconcile(prelim.iloc[:0], final.iloc[:0])
+            kept = _in(kept, set(digests) - stale)
+            fresh = reconcile(_in(prelim, stale), _in(final, stale))
+            _log = (
+                pd.concat([kept, fresh], ignore_index=True)
+                .sort_values(["day", "venue_code", "discipline_code", "start_final", "start_prelim"])
+                .reset_index(drop=True)
+            )
+            _digests.clear()
+            _digests.update(digests)
+
+            counts = _log["change"].value_counts()
+            _runs.append({
+                "time": datetime.datetime.now(datetime.timezone.utc),
+                "files": ", ".join(
+                    os.path.basename(p) for p, changed in
+                    ((PRELIMINARY_PATH, prelim_changed), (FINAL_PATH, final_changed)) if changed
+                ),
+                "partitions": len(digests),
+                "rediffed": len(stale),
+                **{c: int(counts.get(c, 0)) for c in CHANGE_TYPES},
+            })
+
+        return _log.copy(deep=False), pd.DataFrame(_runs)
@@ -0,0 +1,40 @@
+import pandas as pd
+
+# ---------------------------------------
+# Pre-sorted schedule index for the Gantt timeline
+# ---------------------------------------
+# Upper bound on bars sent to the browser in one figure
+PAGE_SIZES = [25, 50, 100]
+
+
+def build_schedule_index(schedule):
+    """Parse and sort schedules.csv once, split per sport (discipline).
+
+    Each frame is sorted by start time and carries a `day` column, so a day
+    window is a binary search and a page is a positional slice.
+    """
+    df = schedule.dropna(subset=["start_date", "end_date"]).copy()
+    df["start_date"] = pd.to_datetime(df["start_date"])
+    df["end_date"] = pd.to_datetime(df["end_date"])
+    df["day"] = df["start_date"].dt.date
+    df["sport"] = df["discipline"]
+    df = df.sort_values(["sport", "start_date"])
+
+    return {
+        sport: grp.reset_index(drop=True)
+        for sport, grp in df.groupby("sport")
+    }
+
+
+def day_window(df, first_day, last_day):
+    """Sessions starting between two days (inclusive) of a sorted frame."""
+    days = df["day"].to_numpy()
+    lo = days.searchsorted(first_day, side="left")
+    hi = days.searchsorted(last_day, side="right")
+    return df.iloc[lo:hi]
+
+
+def page_slice(df, page, page_size):
+    """Rows of one 1-based page."""
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
@@ -0,0 +1,187 @@
+"""Local JSON API over the dashboard queries.
+
+    python -m utils.server --port 8600
+
+Endpoints (GET, query-string parameters as in `python -m utils.cli`):
+    /medals?by=country&country=FRA&country=ITA
+    /athlete?name=...
+    /schedule?start=2024-08-01&end=2024-08-02&discipline=Swimming
+    /venues?discipline=Swimming
+    /rounds?event_code=SWMM100MBA
+    /path?participant_code=1901276
+    /version
+
+Responses are cached per normalized query and carry an ETag; clients that
+send If-None-Match (a list, weak W/ tags accepted) get a 304 when nothing
+changed. Unknown endpoints are 404; missing or invalid parameters are 400;
+any other failure is a 500 with a JSON error. Any change to a file in
+data/ bumps the data version, which drops both the loaded datasets and the
+response cache.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from utils import query
+from utils.cli import run_query
+
+logger = logging.getLogger(__name__)
+
+# Repeatable parameters; elsewhere (e.g. /venues?discipline=) they are scalars
+LIST_PARAMS = {"medals": {"country", "continent", "discipline", "medal_type", "gender"}}
+QUERIES = {"medals", "athlete", "schedule", "venues", "rounds", "path"}
+REQUIRED_PARAMS = {
+    "athlete": ["name"],
+    "schedule": ["start", "end"],
+    "rounds": ["event_code"],
+    "path": ["participant_code"],
+}
+
+
+# ---------------------------------------
+# Response cache
+# ---------------------------------------
+class ResponseCache:
+    """In-process {normalized query: (etag, body)} for one data version."""
+
+    def __init__(self):
+        self.version = None
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.key_locks = {}
+
+    def get(self, key, compute):
+        version = query.refresh_if_changed()
+        with self.lock:
+            if version != self.version:
+                self.entries.clear()
+                self.key_locks.clear()
+                self.version = version
+            if key in self.entries:
+                return self.entries[key]
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+
+        # Concurrent requests for the same key wait for a single computation
+        with key_lock:
+            with self.lock:
+                if key in self.entries:
+                    return self.entries[key]
+            body = compute()
+            etag = '"%s-%s"' % (version, hashlib.sha1(body).hexdigest()[:16])
+            with self.lock:
+                if self.version == version:
+                    self.entries[key] = (etag, body)
+            return etag, body
+
+
+def normalize_query(path, qs):
+    """Cache key and run_query params from a parsed query string."""
+    params = {}
+    list_params = LIST_PARAMS.get(path, set())
+    for k, values in qs.items():
+        if k in list_params:
+            params[k] = sorted(set(values))
+        elif k == "top":
+            params[k] = int(values[0])
+        else:
+            params[k] = values[0]
+    key = (path, tuple(sorted((k, json.dumps(v)) for k, v in params.items())))
+    return key, params
+
+
+def etag_matches(if_none_match, etag):
+    """True if an If-None-Match header lists `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or etag in (t[2:] if t.startswith("W/") else t for t in tags)
+
+
+# ---------------------------------------
+# HTTP handler
+# ---------------------------------------
+class QueryHandler(BaseHTTPRequestHandler):
+    cache = ResponseCache()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        name = url.path.strip("/")
+
+        if name == "version":
+            self.send_json(200, json.dumps({"version": query.refresh_if_changed()}).encode())
+            return
+        if name not in QUERIES:
+            self.send_json(404, json.dumps({"error": f"Unknown endpoint: /{name}"}).encode())
+            return
+
+        try:
+            key, params = normalize_query(name, parse_qs(url.query))
+        except ValueError as e:
+            self.send_json(400, json.dumps({"error": str(e)}).encode())
+            return
+        missing = [p for p in REQUIRED_PARAMS.get(name, []) if p not in params]
+        if missing:
+            self.send_json(400, json.dumps({"error": f"missing parameter: {', '.join(missing)}"}).encode())
+            return
+
+        try:
+            etag, body = self.cache.get(
+                key,
+                lambda: run_query(name, **params).to_json(orient="records", date_format="iso").encode(),
+            )
+        except KeyError as e:
+            # e.g. "Unknown athlete: ..." (404 is reserved for unknown endpoints)
+            self.send_json(400, json.dumps({"error": str(e.args[0])}).encode())
+            return
+        except (ValueError, TypeError) as e:
+            self.send_json(400, json.dumps({"error": str(e)}).encode())
+            return
+        except Exception as e:
+            # Always answer: a dropped connection tells the client nothing
+            logger.exception("Query /%s failed", name)
+            self.send_json(500, json.dumps({"error": f"internal error ({type(e).__name__})"}).encode())
+            return
+
+        if etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_json(200, body, etag)
+
+    def send_json(self, status, body, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.server", description="Local JSON API over the dashboard queries")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    args = parser.parse_args(argv)
+
+    query.refresh_if_changed()
+    query.load_datasets()
+
+    server = ThreadingHTTPServer((args.host, args.port), QueryHandler)
+    print(f"Serving on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import os
+import glob
+import json
+import threading
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc
+import streamlit as st
+
+from utils.preprocessing import data_version
+
+# ---------------------------------------
+# Shared-memory datasets
+# ---------------------------------------
+# With OLYMPICS_SHARED_DIR set (ideally on tmpfs, e.g. /dev/shm/olympics),
+# loader results are written once per data version as Arrow IPC files and
+# every Streamlit worker process memory-maps them read-only. Columns stay
+# Arrow-backed (pd.ArrowDtype), so the page cache of the files is the only
+# copy of the data on the host. Without the variable, loaders fall back to
+# one in-process copy (st.cache_resource).
+SHARED_DIR_ENV = "OLYMPICS_SHARED_DIR"
+
+# name → mapped frames, one per process
+_mapped = {}
+_lock = threading.Lock()
+
+
+def shared_dir():
+    return os.environ.get(SHARED_DIR_ENV)
+
+
+def _to_arrow(df):
+    try:
+        return pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns (e.g. codes read as int and str)
+        df = df.copy()
+        for col in df.columns[df.dtypes == object]:
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+        return pa.Table.from_pandas(df)
+
+
+def _write_arrow(df, path):
+    table = _to_arrow(df)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, path)
+
+
+def _map_arrow(path):
+    source = pa.memory_map(path, "r")
+    table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+# Data versions kept on disk per loader: the current one and the previous
+# one, which another worker may still be about to map
+KEEP_VERSIONS = 2
+
+
+def _prune(name):
+    """Remove the files of every version but the KEEP_VERSIONS newest."""
+    manifests = []
+    for path in glob.glob(os.path.join(shared_dir(), f"{name}-*.json")):
+        try:
+            manifests.append((os.path.getmtime(path), path))
+        except OSError:
+            pass
+    for _, manifest in sorted(manifests, reverse=True)[KEEP_VERSIONS:]:
+        base = manifest[: -len(".json")]
+        # Manifest first: a version without it is never mapped
+        for path in [manifest] + glob.glob(f"{base}-*.arrow"):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def materialize(name, build, version=None):
+    """Write build()'s frames for the current data version, if not done yet.
+
+    Returns the manifest path. The manifest is written last, so its presence
+    means every frame file is complete; concurrent builders simply race to
+    the same atomic rename.
+    """
+    base = os.path.join(shared_dir(), f"{name}-{version or data_version()}")
+    manifest = f"{base}.json"
+    if os.path.exists(manifest):
+        return manifest
+
+    os.makedirs(shared_dir(), exist_ok=True)
+    result = build()
+    frames = result if isinstance(result, tuple) else (result,)
+    for i, df in enumerate(frames):
+        _write_arrow(df, f"{base}-{i}.arrow")
+
+    tmp = f"{manifest}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"frames": len(frames), "tuple": isinstance(result, tuple)}, f)
+    os.replace(tmp, manifest)
+
+    _prune(name)
+    return manifest
+
+
+def _map_manifest(manifest):
+    with open(manifest) as f:
+        meta = json.load(f)
+    base = manifest[: -len(".json")]
+    frames = tuple(_map_arrow(f"{base}-{i}.arrow") for i in range(meta["frames"]))
+    return frames, meta["tuple"]
+
+
+def load_shared(name, build):
+    """Frames of `build`, memory-mapped from the shared Arrow files."""
+    manifest = materialize(name, build)
+    with _lock:
+        if _mapped.get(name, (None,))[0] != manifest:
+            try:
+                frames, is_tuple = _map_manifest(manifest)
+            except FileNotFoundError:
+                # Pruned by another worker after newer data was written:
+                # map the version on disk now
+                manifest = materialize(name, build, version=data_version(max_age=0))
+                frames, is_tuple = _map_manifest(manifest)
+            _mapped[name] = (manifest, frames, is_tuple)
+        _, frames, is_tuple = _mapped[name]
+
+    return _shallow(frames if is_tuple else frames[0])
+
+
+def _shallow(result):
+    # Copy-on-write shallow copies: callers may add or overwrite columns
+    # without touching the cached data, and nothing is copied up front
+    if isinstance(result, tuple):
+        return tuple(df.copy(deep=False) for df in result)
+    return result.copy(deep=False)
+
+
+def cache_frames(name):
+    """Decorator for page loaders returning a DataFrame or a tuple of them."""
+    def decorator(func):
+        # cache_resource rather than cache_data: cache_data unpickles a full
+        # copy of every frame on each rerun of each session
+        cached = st.cache_resource(func)
+
+        def wrapper():
+            if shared_dir():
+                return load_shared(name, func)
+            return _shallow(cached())
+
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+    return decorator
@@ -0,0 +1,195 @@
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+
+import pandas as pd
+
+from utils.preprocessing import DATA_DIR, prepare_medals_datasets
+
+# ---------------------------------------
+# Embedded SQL backend
+# ---------------------------------------
+# OLYMPICS_QUERY_BACKEND=sqlite runs the page filters and aggregations as
+# parameterized SQL over an in-process SQLite database loaded once per
+# process. The default ("pandas") keeps the DataFrame code in the pages.
+BACKEND_ENV = "OLYMPICS_QUERY_BACKEND"
+
+MEDAL_TYPES = ["Gold", "Silver", "Bronze"]
+
+_lock = threading.Lock()
+
+
+def use_sql_backend():
+    return os.environ.get(BACKEND_ENV, "pandas").lower() == "sqlite"
+
+
+@lru_cache(maxsize=None)
+def connect():
+    """In-memory database with medallists, events and schedules."""
+    con = sqlite3.connect(":memory:", check_same_thread=False)
+
+    _, medallists, _ = prepare_medals_datasets()
+    events = pd.read_csv(os.path.join(DATA_DIR, "events.csv"))
+    schedules = pd.read_csv(os.path.join(DATA_DIR, "schedules.csv"))
+
+    start = pd.to_datetime(schedules["start_date"])
+    end = pd.to_datetime(schedules["end_date"])
+    schedules["duration_days"] = (end - start).dt.total_seconds() / (24 * 3600)
+
+    medallists.to_sql("medallists", con, index=False)
+    events[["event", "sport"]].to_sql("events", con, index=False)
+    schedules.to_sql("schedules", con, index=False)
+
+    for table, col in [
+        ("medallists", "country_code"),
+        ("medallists", "discipline"),
+        ("medallists", "event"),
+        ("events", "event"),
+        ("schedules", "event"),
+    ]:
+        con.execute(f'CREATE INDEX idx_{table}_{col} ON {table} ("{col}")')
+    return con
+
+
+def _columns(table):
+    return {row[1] for row in connect().execute(f"PRAGMA table_info({table})")}
+
+
+def _in(col, values, params):
+    params.extend(values)
+    return f'"{col}" IN ({", ".join("?" * len(values))})'
+
+
+def where_clause(filters, table="medallists", alias=None):
+    """Translate the global filter dict into a WHERE clause and parameters.
+
+    Mirrors `apply_global_filters`: a filter applies only when its column
+    exists and at least one value is selected.
+    """
+    columns = _columns(table)
+    prefix = f"{alias}." if alias else ""
+    conditions, params = [], []
+
+    checks = [
+        ("continent", filters["continent"]),
+        (filters["country_col"], filters["selected_countries"]),
+        (filters["sport_col"], filters["selected_sports"]),
+        ("medal_type", filters["selected_medal_types"]),
+        ("gender", filters["selected_genders"]),
+    ]
+    for col, values in checks:
+        if col and col in columns and values:
+            conditions.append(prefix + _in(col, list(values), params))
+
+    clause = " AND ".join(conditions) if conditions else "1"
+    return clause, params
+
+
+def run_sql(sql, params=()):
+    with _lock:
+        return pd.read_sql_query(sql, connect(), params=list(params))
+
+
+# ---------------------------------------
+# Page aggregations
+# ---------------------------------------
+def filtered_medallists(filters):
+    where, params = where_clause(filters)
+    return run_sql(f"SELECT * FROM medallists WHERE {where}", params)
+
+
+def count_medallists(filters):
+    where, params = where_clause(filters)
+    return int(run_sql(f"SELECT COUNT(*) AS n FROM medallists WHERE {where}", params)["n"].iloc[0])
+
+
+def country_medals(filters):
+    where, params = where_clause(filters)
+    return run_sql(f"""
+        SELECT country_code, country_long,
+               SUM(medal_type = 'Gold') AS Gold,
+               SUM(medal_type = 'Silver') AS Silver,
+               SUM(medal_type = 'Bronze') AS Bronze,
+               SUM(medal_type IN ('Gold', 'Silver', 'Bronze')) AS Total
+        FROM medallists
+        WHERE {where} AND country_long IS NOT NULL
+        GROUP BY country_code, country_long
+        ORDER BY Total DESC, country_code
+    """, params)
+
+
+def medal_counts_by(filters, dims):
+    """(dims..., medal_type, count) for Gold/Silver/Bronze rows."""
+    where, params = where_clause(filters)
+    cols = ", ".join(f'"{d}"' for d in dims)
+    not_null = " AND ".join(f'"{d}" IS NOT NULL' for d in dims)
+    return run_sql(f"""
+        SELECT {cols}, medal_type, COUNT(*) AS count
+        FROM medallists
+        WHERE {where} AND {not_null}
+          AND medal_type IN ('Gold', 'Silver', 'Bronze')
+        GROUP BY {cols}, medal_type
+        ORDER BY {cols}, medal_type
+    """, params)
+
+
+def sunburst_counts(filters):
+    where, params = where_clause(filters)
+    return run_sql(f"""
+        SELECT continent, country, discipline, COUNT(*) AS count
+        FROM medallists
+        WHERE {where}
+          AND continent IS NOT NULL AND country IS NOT NULL AND discipline IS NOT NULL
+        GROUP BY continent, country, discipline
+        ORDER BY continent, country, discipline
+    """, params)
+
+
+def top_sport_medals(filters, n=10):
+    where, params = where_clause(filters)
+    return run_sql(f"""
+        WITH rows AS (
+            SELECT discipline, medal_type FROM medallists
+            WHERE {where} AND discipline IS NOT NULL
+              AND medal_type IN ('Gold', 'Silver', 'Bronze')
+        ),
+        top AS (
+            SELECT discipline FROM rows
+            GROUP BY discipline ORDER BY COUNT(*) DESC, discipline LIMIT ?
+        )
+        SELECT discipline, medal_type, COUNT(*) AS count
+        FROM rows
+        WHERE discipline IN (SELECT discipline FROM top)
+        GROUP BY discipline, medal_type
+        ORDER BY discipline, medal_type
+    """, params + [n])
+
+
+def sport_country_counts(filters):
+    """Medal rows per (sport, country), sport taken from events.csv."""
+    where, params = where_clause(filters, alias="m")
+    return run_sql(f"""
+        SELECT e.sport AS sport, m.country AS country, COUNT(*) AS "Total Medals"
+        FROM medallists m
+        LEFT JOIN events e ON m.event = e.event
+        WHERE {where} AND e.sport IS NOT NULL AND m.country IS NOT NULL
+        GROUP BY e.sport, m.country
+        ORDER BY e.sport, m.country
+    """, params)
+
+
+def venue_durations(sports=None):
+    """Total session duration (days) per venue, optionally for some sports."""
+    params = []
+    where = "1"
+    if sports:
+        where = "e." + _in("sport", list(sports), params)
+    return run_sql(f"""
+        SELECT s.venue AS venue, ROUND(TOTAL(s.duration_days), 2) AS duration_days
+        FROM schedules s
+        LEFT JOIN events e ON s.event = e.event
+        WHERE {where} AND s.venue IS NOT NULL
+        GROUP BY s.venue
+        ORDER BY duration_days DESC
+    """, params)
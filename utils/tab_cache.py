@@ -0,0 +1,92 @@
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pandas as pd
+
+from utils.preprocessing import data_version
+
+# ---------------------------------------
+# Per-tab frames, cached per filter state
+# ---------------------------------------
+# Pages compute only the frames of the open tab in the script thread, then
+# queue the other tabs' frames on a worker thread. Results are Futures keyed
+# by (page, frame, filter state, data version) and shared by every session
+# of the process, so switching tab (or another user with the same filters)
+# usually finds the frame ready.
+MAX_ENTRIES = 256
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tab-prewarm")
+_results = OrderedDict()  # key → Future
+_lock = threading.Lock()
+
+
+def filter_state(filters):
+    """Order-insensitive string key of a global filter dict."""
+    return json.dumps(
+        {k: sorted(v) if isinstance(v, list) else v for k, v in filters.items()},
+        sort_keys=True, default=str,
+    )
+
+
+def _key(page, name, filters):
+    return (page, name, filter_state(filters), data_version())
+
+
+def _store(key, future):
+    _results[key] = future
+    while len(_results) > MAX_ENTRIES:
+        _results.popitem(last=False)
+
+
+def _drop_failed(key, future):
+    # Failed computations are not cached: the next request retries
+    if future.exception() is not None:
+        with _lock:
+            if _results.get(key) is future:
+                del _results[key]
+
+
+def _shallow(result):
+    # Frames are handed out as CoW shallow copies; other results are read-only
+    return result.copy(deep=False) if isinstance(result, pd.DataFrame) else result
+
+
+def get_frame(page, name, filters, compute):
+    """Frame `name` for these filters: cached, pre-warmed, or computed now."""
+    key = _key(page, name, filters)
+    with _lock:
+        future = _results.get(key)
+        if future is None:
+            future = Future()
+            _store(key, future)
+            owner = True
+        else:
+            _results.move_to_end(key)
+            owner = False
+
+    if owner:
+        try:
+            future.set_result(compute())
+        except Exception as e:
+            future.set_exception(e)
+        _drop_failed(key, future)
+
+    # Waits if the worker thread is still computing it
+    return _shallow(future.result())
+
+
+def prewarm(page, computes, filters):
+    """Queue every frame of `computes` ({name: callable}) not cached yet.
+
+    Callables run on the worker thread: they must not call Streamlit.
+    """
+    for name, compute in computes.items():
+        key = _key(page, name, filters)
+        with _lock:
+            if key in _results:
+                continue
+            future = _executor.submit(compute)
+            _store(key, future)
+        future.add_done_callback(lambda f, key=key: _drop_failed(key, f))
@@ -0,0 +1,252 @@
+"""Deploy-time materialization of the default (unfiltered) page views.
+
+    python -m utils.views build      # run once per deploy, after checkout
+    python -m utils.views status
+
+Every page aggregation at default filters is written as Parquet under
+build/views/<data hash>/, and build/views/manifest.json records the data
+hash, the per-file hashes and the artifact paths. At runtime a page whose
+filters are all at their defaults reads its frames from disk instead of
+loading, filtering and aggregating; any change to data/ invalidates the
+manifest and pages fall back to computing.
+"""
+import argparse
+import datetime
+import glob
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+from functools import lru_cache
+
+import pandas as pd
+
+from utils.preprocessing import DATA_DIR, prepare_medals_datasets, data_version
+from utils.filters import filter_options, apply_global_filters
+from utils.leaderboard import build_leaderboard, top_n
+from utils.query import filters_to_params
+from utils.cli import run_query
+from utils.aggregations import (
+    aggregate_continent_medals,
+    aggregate_sunburst,
+    aggregate_gender_medals,
+    aggregate_top_sports,
+    aggregate_sport_country,
+    filter_schedule_by_sport,
+    aggregate_venue_durations,
+    aggregate_medal_pie,
+    aggregate_athlete_medals,
+    aggregate_gender_counts,
+    overview_kpis,
+)
+
+logger = logging.getLogger(__name__)
+_fallbacks_logged = set()
+
+VIEWS_DIR = os.path.join(os.path.dirname(DATA_DIR), "build", "views")
+MANIFEST_PATH = os.path.join(VIEWS_DIR, "manifest.json")
+
+
+# ---------------------------------------
+# Data hashes
+# ---------------------------------------
+def data_file_hashes():
+    """sha256 of every data file, keyed by path relative to data/."""
+    hashes = {}
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, "**", "*.csv"), recursive=True)):
+        with open(path, "rb") as f:
+            hashes[os.path.relpath(path, DATA_DIR)] = hashlib.sha256(f.read()).hexdigest()
+    return hashes
+
+
+def content_version(hashes):
+    h = hashlib.sha256()
+    for name, digest in sorted(hashes.items()):
+        h.update(f"{name}:{digest}".encode())
+    return h.hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def _hashes_for(stat_version):
+    # Content hashing reads every file: do it at most once per stat signature
+    return data_file_hashes()
+
+
+# ---------------------------------------
+# Default views
+# ---------------------------------------
+def build_home_views():
+    medals_total, _, _ = prepare_medals_datasets()
+    athletes = pd.read_csv(os.path.join(DATA_DIR, "athletes.csv"))
+    events = pd.read_csv(os.path.join(DATA_DIR, "events.csv"))
+
+    filters = filter_options(athletes)
+    countries = filters["selected_countries"]
+    athletes_filtered = athletes[athletes["country_code"].isin(countries)]
+    medals_total_filtered = medals_total[medals_total["country_code"].isin(countries)]
+
+    kpis = overview_kpis(athletes_filtered, medals_total, medals_total_filtered, events, countries)
+    return {
+        "kpis": pd.DataFrame([kpis]),
+        "medal_pie": aggregate_medal_pie(medals_total_filtered, filters["selected_medal_types"]),
+        "top10": top_n(build_leaderboard(medals_total), "total", 10, countries=countries),
+    }
+
+
+def build_global_analysis_views():
+    _, medallists, _ = prepare_medals_datasets()
+    filters = filter_options(medallists)
+    df_filtered = apply_global_filters(medallists, filters)
+    return {
+        "country_medals": run_query("medals", by="country", **filters_to_params(filters)),
+        "continent_medals": aggregate_continent_medals(df_filtered),
+        "sunburst": aggregate_sunburst(df_filtered),
+        "gender_medals": aggregate_gender_medals(df_filtered),
+        "top_sports": aggregate_top_sports(df_filtered, 10),
+    }
+
+
+def build_sports_events_views():
+    _, medallists, _ = prepare_medals_datasets()
+    events = pd.read_csv(os.path.join(DATA_DIR, "events.csv"))
+    schedule = pd.read_csv(os.path.join(DATA_DIR, "schedules.csv"))
+
+    filters = filter_options(medallists)
+    df_filtered = apply_global_filters(medallists, filters)
+    return {
+        "treemap": aggregate_sport_country(df_filtered, events),
+        "venue_intensity": aggregate_venue_durations(filter_schedule_by_sport(schedule, events, filters)),
+    }
+
+
+def build_athlete_performance_views():
+    athletes = pd.read_csv(os.path.join(DATA_DIR, "athletes.csv"))
+    medals = pd.read_csv(os.path.join(DATA_DIR, "medals.csv"))
+
+    # Ages depend on today's date, so the age charts are always computed;
+    # the page only keeps athletes with a birth date
+    born = pd.to_datetime(athletes["birth_date"], errors="coerce").notna()
+    return {
+        "medal_counts": aggregate_athlete_medals(medals),
+        "gender_counts": aggregate_gender_counts(athletes[born]),
+    }
+
+
+VIEW_BUILDERS = {
+    "home": build_home_views,
+    "global_analysis": build_global_analysis_views,
+    "sports_events": build_sports_events_views,
+    "athlete_performance": build_athlete_performance_views,
+}
+
+
+# ---------------------------------------
+# Build / load
+# ---------------------------------------
+def build_views():
+    """Materialize the default views and write a new manifest."""
+    hashes = data_file_hashes()
+    version = content_version(hashes)
+    version_dir = os.path.join(VIEWS_DIR, version)
+
+    views = {}
+    for page, builder in VIEW_BUILDERS.items():
+        os.makedirs(os.path.join(version_dir, page), exist_ok=True)
+        views[page] = {}
+        for name, df in builder().items():
+            rel = os.path.join(version, page, f"{name}.parquet")
+            df.to_parquet(os.path.join(VIEWS_DIR, rel), index=False)
+            views[page][name] = rel
+
+    manifest = {
+        "version": version,
+        "data_version": data_version(max_age=0),
+        "built_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "data_files": hashes,
+        "views": views,
+    }
+    tmp = f"{MANIFEST_PATH}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, MANIFEST_PATH)
+
+    # Keep only the current version on disk
+    for path in glob.glob(os.path.join(VIEWS_DIR, "*", "")):
+        if os.path.basename(os.path.normpath(path)) != version:
+            shutil.rmtree(path, ignore_errors=True)
+    return manifest
+
+
+def check_manifest():
+    """(manifest, None) if the views match the data on disk, else (None, why not)."""
+    if not os.path.exists(MANIFEST_PATH):
+        return None, f"no manifest at {MANIFEST_PATH}"
+    with open(MANIFEST_PATH) as f:
+        manifest = json.load(f)
+
+    stat_version = data_version()
+    if manifest.get("data_version") == stat_version:
+        return manifest, None
+    # Same content, different mtimes (e.g. copied after the build)
+    hashes = _hashes_for(stat_version)
+    if manifest.get("version") == content_version(hashes):
+        return manifest, None
+
+    built = manifest.get("data_files", {})
+    changes = (
+        [f"{name} added" for name in sorted(set(hashes) - set(built))]
+        + [f"{name} missing" for name in sorted(set(built) - set(hashes))]
+        + [f"{name} modified" for name in sorted(set(hashes) & set(built)) if hashes[name] != built[name]]
+    )
+    return None, f"data changed since the build ({', '.join(changes)})"
+
+
+@lru_cache(maxsize=None)
+def _load_page_views(page, version):
+    with open(MANIFEST_PATH) as f:
+        paths = json.load(f)["views"].get(page)
+    if not paths:
+        return None
+    return {name: pd.read_parquet(os.path.join(VIEWS_DIR, rel)) for name, rel in paths.items()}
+
+
+def load_views(page):
+    """Materialized default frames of a page, or None if unavailable/stale."""
+    manifest, reason = check_manifest()
+    if manifest is None:
+        # Once per page and reason, not on every rerun
+        if (page, reason) not in _fallbacks_logged:
+            _fallbacks_logged.add((page, reason))
+            logger.warning("Views for %s not used, computing live: %s", page, reason)
+        return None
+    views = _load_page_views(page, manifest["version"])
+    if views is None:
+        return None
+    # Callers get their own frames; the cached ones stay untouched
+    return {name: df.copy(deep=False) for name, df in views.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.views", description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["build", "status"])
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        manifest = build_views()
+        for page, views in manifest["views"].items():
+            print(f"{page}: {', '.join(views)}")
+        print(f"version {manifest['version']} → {MANIFEST_PATH}")
+        return 0
+
+    manifest, reason = check_manifest()
+    if manifest is None:
+        print(f"No up-to-date views: {reason} (run: python -m utils.views build)")
+        return 1
+    print(f"version {manifest['version']} built {manifest['built_at']}: {', '.join(manifest['views'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())